@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     gemini_final_model: str = "gemini-2.5-flash"
     gemini_label_model: str = "gemini-2.5-flash-lite"
 
+    # LLM concurrency (per process, across all in-flight pipelines)
+    llm_max_concurrency: int = 32
+    llm_response_cache_ttl_s: int = 600  # exact-match cache for low-temperature calls; 0 disables
+
     # Segmenter
     segmenter_max_segment_length: int = 250
     segmenter_discourse_marker_min_length: int = 80
@@ -1,10 +1,64 @@
 """Model-name-based LLM call router.
 
 Routes to Gemini or OpenAI based on model name prefix.
+Analysis calls that opt in (cacheable=True) are served from a short-lived exact-match cache.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
 from app.models.domain import LlmCallResult
 
+# Caps concurrent non-streaming calls so parallel gating/labeling/cushion fan-out
+# across pipelines stays within provider rate limits
+_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+# Only opted-in, near-deterministic calls are cached. Final generation and its
+# retry never opt in, so user-visible output always comes from the model.
+_CACHEABLE_MAX_TEMP = 0.3
+_CACHE_MAX_ENTRIES = 1024
+
+_cache: OrderedDict[str, tuple[float, LlmCallResult]] = OrderedDict()
+
+
+def _cache_key(
+    model: str,
+    system_prompt: str,
+    user_message: str,
+    temp: float,
+    max_tokens: int,
+    analysis_context: str | None,
+    thinking_budget: int | None,
+) -> str:
+    h = hashlib.sha256()
+    for part in (model, system_prompt, user_message, repr((temp, max_tokens, thinking_budget)), analysis_context or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _cache_get(key: str) -> LlmCallResult | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at < time.monotonic():
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key: str, result: LlmCallResult) -> None:
+    _cache[key] = (time.monotonic() + settings.llm_response_cache_ttl_s, result)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
 
 async def call_llm(
     model: str,
@@ -15,18 +69,35 @@ async def call_llm(
     analysis_context: str | None,
     *,
     thinking_budget: int | None = None,
+    cacheable: bool = False,
 ) -> LlmCallResult:
-    """Route LLM call to the appropriate provider based on model name prefix."""
-    if model.startswith("gemini-"):
-        from app.pipeline.ai_gemini_service import call_gemini
-
-        return await call_gemini(
-            model, system_prompt, user_message, temp, max_tokens, analysis_context,
-            thinking_budget=thinking_budget,
-        )
-    else:
-        from app.pipeline.ai_transform_service import call_openai_with_model
-
-        return await call_openai_with_model(
-            model, system_prompt, user_message, temp, max_tokens, analysis_context,
-        )
+    """Route LLM call to the appropriate provider based on model name prefix.
+
+    cacheable: serve repeated identical low-temperature calls from the response cache.
+    """
+    key: str | None = None
+    if cacheable and settings.llm_response_cache_ttl_s > 0 and 0 <= temp <= _CACHEABLE_MAX_TEMP:
+        key = _cache_key(model, system_prompt, user_message, temp, max_tokens, analysis_context, thinking_budget)
+        cached = _cache_get(key)
+        if cached is not None:
+            # No tokens were spent on a hit
+            return dataclasses.replace(cached, prompt_tokens=0, completion_tokens=0)
+
+    async with _semaphore:
+        if model.startswith("gemini-"):
+            from app.pipeline.ai_gemini_service import call_gemini
+
+            result = await call_gemini(
+                model, system_prompt, user_message, temp, max_tokens, analysis_context,
+                thinking_budget=thinking_budget,
+            )
+        else:
+            from app.pipeline.ai_transform_service import call_openai_with_model
+
+            result = await call_openai_with_model(
+                model, system_prompt, user_message, temp, max_tokens, analysis_context,
+            )
+
+    if key is not None:
+        _cache_put(key, result)
+    return result
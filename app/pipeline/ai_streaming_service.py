@@ -7,21 +7,22 @@ Produces exact `event:\ndata:\n\n` format the frontend expects.
 """
 
 import asyncio
-import json
+import contextlib
 import logging
+import re
 import time
 from collections.abc import AsyncGenerator
 
 import google.genai as genai
+import orjson
 from google.genai.types import GenerateContentConfig, ThinkingConfig
-from openai import AsyncOpenAI
 
 from app.core.config import settings
 from app.models.domain import LabeledSegment, LockedSpan, Segment
 from app.models.enums import Purpose, SegmentLabelTier, Topic
 from app.pipeline import cache_metrics_tracker
 from app.pipeline.ai_call_router import call_llm
-from app.pipeline.ai_transform_service import AiTransformError
+from app.pipeline.ai_transform_service import AiTransformError, get_openai_client, prompt_cache_key
 from app.pipeline.gating.situation_analysis_service import SituationAnalysisResult
 from app.pipeline.multi_model_pipeline import (
     PipelineProgressCallback,
@@ -35,17 +36,9 @@ from app.pipeline.validation import output_validator
 
 logger = logging.getLogger(__name__)
 
-_client: AsyncOpenAI | None = None
 _gemini_client: genai.Client | None = None
 
 
-def _get_client() -> AsyncOpenAI:
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=settings.openai_api_key)
-    return _client
-
-
 def _get_gemini_client() -> genai.Client:
     global _gemini_client
     if _gemini_client is None:
@@ -53,6 +46,77 @@ def _get_gemini_client() -> genai.Client:
     return _gemini_client
 
 
+# Bounded so a stalled client cannot grow the queue without limit
+_QUEUE_MAXSIZE = 1024
+
+# sse-starlette passes bytes through untouched, so frames are encoded once here
+_SSE_LINE_SEP = re.compile(rb"\r\n|\r|\n")
+
+
+def _encode_sse_frame(event_name: str, data) -> bytes:
+    """Encode one SSE frame in sse-starlette's wire format.
+
+    str payloads are sent verbatim (split into one `data:` line per line);
+    everything else is serialized with orjson, whose output is a single line.
+    """
+    if isinstance(data, str):
+        data_lines = b"".join(b"data: %b\r\n" % line for line in _SSE_LINE_SEP.split(data.encode()))
+    else:
+        data_lines = b"data: %b\r\n" % orjson.dumps(data)
+    return b"event: %b\r\n%b\r\n" % (event_name.encode(), data_lines)
+
+
+async def _close_pipeline_task(
+    task: asyncio.Task, queue: asyncio.Queue[bytes | None], *, finished: bool,
+) -> None:
+    """Stop the SSE producer task when its generator exits.
+
+    On early exit (client disconnect) the producer is cancelled rather than
+    drained: the cancellation is re-delivered on every await, so draining would
+    orphan the task. The queue is emptied without awaiting so the producer's
+    sentinel put cannot block on a full queue while it unwinds.
+    """
+    if not finished:
+        task.cancel()
+        while not queue.empty():
+            queue.get_nowait()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+
+
+def _collect_enforced_views(
+    enforced: list[LabeledSegment],
+) -> tuple[list[dict], list[dict], list[str], int]:
+    """Single pass over enforced labels for the text-only streams.
+
+    Returns (labels event data, processedSegments event data, YELLOW texts, GREEN count).
+    """
+    red = SegmentLabelTier.RED
+    yellow = SegmentLabelTier.YELLOW
+    green = SegmentLabelTier.GREEN
+
+    labels_data: list[dict] = []
+    seg_redacted: list[dict] = []
+    yellow_texts: list[str] = []
+    green_count = 0
+    for s in enforced:
+        tier = s.label.tier
+        tier_name = tier.name
+        label_name = s.label.name
+        labels_data.append({"segmentId": s.segment_id, "label": label_name, "tier": tier_name, "text": s.text})
+        seg_redacted.append({
+            "id": s.segment_id,
+            "tier": tier_name,
+            "label": label_name,
+            "text": None if tier is red else s.text,
+        })
+        if tier is yellow:
+            yellow_texts.append(s.text)
+        elif tier is green:
+            green_count += 1
+    return labels_data, seg_redacted, yellow_texts, green_count
+
+
 async def stream_transform(
     original_text: str,
     user_prompt: str | None,
@@ -61,16 +125,20 @@ async def stream_transform(
     topic: Topic | None,
     purpose: Purpose | None,
     final_max_tokens: int,
-) -> AsyncGenerator[dict, None]:
+) -> AsyncGenerator[bytes, None]:
     """Async generator that yields SSE events for the full transform pipeline.
 
     Event names: phase, spans, maskedText, segments, labels, situationAnalysis,
     processedSegments, templateSelected, delta, retry, validationIssues, stats, usage, done, error
     """
-    queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
 
     async def push_event(event_name: str, data) -> None:
-        await queue.put({"event": event_name, "data": data if isinstance(data, str) else json.dumps(data)})
+        frame = _encode_sse_frame(event_name, data)
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            await queue.put(frame)
 
     # Build progress callback
     class StreamCallback(PipelineProgressCallback):
@@ -186,14 +254,9 @@ async def stream_transform(
             # 4. Validate output
             await push_event("phase", "validating")
 
-            yellow_texts = [
-                s.text for s in analysis.labeled_segments
-                if s.label.tier == SegmentLabelTier.YELLOW
-            ]
-
             validation = output_validator.validate_with_template(
                 final_stream_result["unmasked_text"], original_text, prompt.locked_spans,
-                final_stream_result["raw_content"], prompt.redaction_map, yellow_texts,
+                final_stream_result["raw_content"], prompt.redaction_map, analysis.yellow_texts,
                 analysis.chosen_template, analysis.effective_sections, analysis.labeled_segments,
             )
 
@@ -216,7 +279,7 @@ async def stream_transform(
                 error_hint = "\n\n[시스템 검증 오류] " + "; ".join(
                     i.message for i in validation.errors()
                 )
-                retry_user = prompt.user_message + error_hint + locked_span_hint
+                retry_user = "".join((prompt.user_message, error_hint, locked_span_hint))
 
                 retry_thinking = min(1024, thinking_budget * 2) if thinking_budget else None
 
@@ -228,7 +291,7 @@ async def stream_transform(
 
                 validation = output_validator.validate_with_template(
                     active_result["unmasked_text"], original_text, prompt.locked_spans,
-                    active_result["raw_content"], prompt.redaction_map, yellow_texts,
+                    active_result["raw_content"], prompt.redaction_map, analysis.yellow_texts,
                     analysis.chosen_template, analysis.effective_sections, analysis.labeled_segments,
                 )
 
@@ -302,6 +365,7 @@ async def stream_transform(
     task = asyncio.create_task(run_pipeline())
 
     # Yield events from queue
+    event: bytes | None = b""
     try:
         while True:
             event = await queue.get()
@@ -309,12 +373,7 @@ async def stream_transform(
                 break
             yield event
     finally:
-        # Ensure the pipeline task completes even if the generator is cancelled
-        if not task.done():
-            try:
-                await task
-            except Exception:
-                pass
+        await _close_pipeline_task(task, queue, finished=event is None)
 
 
 async def stream_text_only(
@@ -322,7 +381,7 @@ async def stream_text_only(
     sender_info: str | None,
     user_prompt: str | None,
     final_max_tokens: int,
-) -> AsyncGenerator[dict, None]:
+) -> AsyncGenerator[bytes, None]:
     """Async generator that yields SSE events for the text-only transform pipeline.
 
     Reuses text_only_pipeline logic with streaming final model via _stream_final_model().
@@ -333,7 +392,7 @@ async def stream_text_only(
     from app.pipeline.preprocessing import locked_span_extractor, text_normalizer
     from app.pipeline.redaction import redaction_service
     from app.pipeline.segmentation import llm_segment_refiner, meaning_segmenter
-    from app.pipeline.template.template_registry import TemplateRegistry
+    from app.pipeline.template.template_registry import get_registry
     from app.pipeline.text_only_pipeline import (
         _apply_s2_enforcement,
         _build_ordered_segments,
@@ -342,17 +401,21 @@ async def stream_text_only(
         _build_user_message,
     )
 
-    queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
 
     async def push_event(event_name: str, data) -> None:
-        await queue.put({"event": event_name, "data": data if isinstance(data, str) else json.dumps(data)})
+        frame = _encode_sse_frame(event_name, data)
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            await queue.put(frame)
 
     async def run_pipeline() -> None:
         try:
             start_time = time.monotonic()
             total_prompt_tokens = 0
             total_completion_tokens = 0
-            registry = TemplateRegistry()
+            registry = get_registry()
 
             # 1. Preprocessing
             await push_event("phase", "normalizing")
@@ -400,13 +463,14 @@ async def stream_text_only(
 
             # RED enforcement
             enforced = red_label_enforcer.enforce(label_result.labeled_segments)
-
-            labels_data = [
-                {"segmentId": s.segment_id, "label": s.label.name, "tier": s.label.tier.name, "text": s.text}
-                for s in enforced
-            ]
+            labels_data, seg_redacted, yellow_texts, green_count = _collect_enforced_views(enforced)
             await push_event("labels", labels_data)
 
+            # Template prep is pure CPU — do it while SA is still in flight
+            label_stats = LabelStats.from_segments(enforced)
+            template = registry.get_default()
+            sections = _apply_s2_enforcement(list(template.section_order), label_stats)
+
             # Collect SA result
             try:
                 sa_result = await sa_task
@@ -430,9 +494,6 @@ async def stream_text_only(
 
             # 3. Template: T01 fixed + S2 enforcement
             await push_event("phase", "template_selecting")
-            label_stats = LabelStats.from_segments(enforced)
-            template = registry.get_default()
-            sections = _apply_s2_enforcement(list(template.section_order), label_stats)
 
             await push_event("templateSelected", {
                 "templateId": template.id,
@@ -444,20 +505,11 @@ async def stream_text_only(
             await push_event("phase", "redacting")
             redaction = redaction_service.process(enforced)
 
-            seg_redacted = [
-                {
-                    "id": ls.segment_id,
-                    "tier": ls.label.tier.name,
-                    "label": ls.label.name,
-                    "text": None if ls.label.tier == SegmentLabelTier.RED else ls.text,
-                }
-                for ls in enforced
-            ]
             await push_event("processedSegments", seg_redacted)
 
             # 4b. Cushion strategy (if YELLOW segments exist)
             cushion_strategy = None
-            if any(s.label.tier == SegmentLabelTier.YELLOW for s in enforced):
+            if yellow_texts:
                 await push_event("phase", "cushion_strategizing")
                 try:
                     from app.pipeline.cushion.cushion_strategy_service import generate as generate_cushion
@@ -498,7 +550,6 @@ async def stream_text_only(
 
             # 7. Validate
             await push_event("phase", "validating")
-            yellow_texts = [s.text for s in enforced if s.label.tier == SegmentLabelTier.YELLOW]
 
             validation = output_validator.validate_with_template(
                 final_stream_result["unmasked_text"], original_text, spans,
@@ -531,7 +582,7 @@ async def stream_text_only(
                     "구어체 접속사(어쨌든/아무튼/걍/근데)를 비즈니스 접속사로 대체하세요."
                 )
                 retry_system = system_prompt + retry_hint
-                retry_user = user_message + error_hint + locked_span_hint
+                retry_user = "".join((user_message, error_hint, locked_span_hint))
 
                 retry_thinking = min(1024, thinking_budget * 2) if thinking_budget else None
 
@@ -562,7 +613,6 @@ async def stream_text_only(
 
             # 9. Send stats
             total_latency = int((time.monotonic() - start_time) * 1000)
-            green_count = sum(1 for s in enforced if s.label.tier == SegmentLabelTier.GREEN)
             yellow_count = redaction.yellow_count
             red_count = redaction.red_count
 
@@ -618,6 +668,7 @@ async def stream_text_only(
 
     task = asyncio.create_task(run_pipeline())
 
+    event: bytes | None = b""
     try:
         while True:
             event = await queue.get()
@@ -625,11 +676,7 @@ async def stream_text_only(
                 break
             yield event
     finally:
-        if not task.done():
-            try:
-                await task
-            except Exception:
-                pass
+        await _close_pipeline_task(task, queue, finished=event is None)
 
 
 async def stream_text_only_ab(
@@ -637,7 +684,7 @@ async def stream_text_only_ab(
     sender_info: str | None,
     user_prompt: str | None,
     final_max_tokens: int,
-) -> AsyncGenerator[dict, None]:
+) -> AsyncGenerator[bytes, None]:
     """A/B test: runs both baseline (A) and cushion-strategy-enhanced (B) transforms.
 
     Shared analysis phase, then:
@@ -651,7 +698,7 @@ async def stream_text_only_ab(
     from app.pipeline.preprocessing import locked_span_extractor, text_normalizer
     from app.pipeline.redaction import redaction_service
     from app.pipeline.segmentation import llm_segment_refiner, meaning_segmenter
-    from app.pipeline.template.template_registry import TemplateRegistry
+    from app.pipeline.template.template_registry import get_registry
     from app.pipeline.text_only_pipeline import (
         _apply_s2_enforcement,
         _build_ordered_segments,
@@ -660,17 +707,21 @@ async def stream_text_only_ab(
         _build_user_message,
     )
 
-    queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
 
     async def push_event(event_name: str, data) -> None:
-        await queue.put({"event": event_name, "data": data if isinstance(data, str) else json.dumps(data)})
+        frame = _encode_sse_frame(event_name, data)
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            await queue.put(frame)
 
     async def run_pipeline() -> None:
         try:
             start_time = time.monotonic()
             total_prompt_tokens = 0
             total_completion_tokens = 0
-            registry = TemplateRegistry()
+            registry = get_registry()
 
             # ===== SHARED ANALYSIS (same as stream_text_only steps 1-4) =====
 
@@ -716,13 +767,13 @@ async def stream_text_only_ab(
             total_completion_tokens += label_result.completion_tokens
 
             enforced = red_label_enforcer.enforce(label_result.labeled_segments)
-
-            labels_data = [
-                {"segmentId": s.segment_id, "label": s.label.name, "tier": s.label.tier.name, "text": s.text}
-                for s in enforced
-            ]
+            labels_data, seg_redacted, yellow_texts, green_count = _collect_enforced_views(enforced)
             await push_event("labels", labels_data)
 
+            label_stats = LabelStats.from_segments(enforced)
+            template = registry.get_default()
+            sections = _apply_s2_enforcement(list(template.section_order), label_stats)
+
             try:
                 sa_result = await sa_task
             except Exception as e:
@@ -743,9 +794,6 @@ async def stream_text_only_ab(
             sa_result = situation_analysis_service.filter_red_facts(sa_result, masked, enforced)
 
             await push_event("phase", "template_selecting")
-            label_stats = LabelStats.from_segments(enforced)
-            template = registry.get_default()
-            sections = _apply_s2_enforcement(list(template.section_order), label_stats)
 
             await push_event("templateSelected", {
                 "templateId": template.id,
@@ -756,15 +804,6 @@ async def stream_text_only_ab(
             await push_event("phase", "redacting")
             redaction = redaction_service.process(enforced)
 
-            seg_redacted = [
-                {
-                    "id": ls.segment_id,
-                    "tier": ls.label.tier.name,
-                    "label": ls.label.name,
-                    "text": None if ls.label.tier == SegmentLabelTier.RED else ls.text,
-                }
-                for ls in enforced
-            ]
             await push_event("processedSegments", seg_redacted)
 
             # Build shared prompt parts
@@ -777,8 +816,6 @@ async def stream_text_only_ab(
             if final_model.startswith("gemini-"):
                 thinking_budget = compute_thinking_budget(segments, enforced, len(original_text))
 
-            yellow_texts = [s.text for s in enforced if s.label.tier == SegmentLabelTier.YELLOW]
-
             # ===== VARIANT A + CUSHION GENERATION (parallel) =====
 
             await push_event("phase", "generating_a")
@@ -798,65 +835,78 @@ async def stream_text_only_ab(
                 delta_event_name="delta",
             )
 
-            # Validate A
-            validation_a = output_validator.validate_with_template(
+            # Validate A off the event loop while cushion + B proceed
+            validation_a_task = asyncio.create_task(asyncio.to_thread(
+                output_validator.validate_with_template,
                 result_a["unmasked_text"], original_text, spans,
                 result_a["raw_content"], redaction.redaction_map, yellow_texts,
                 template, sections, enforced,
-            )
+            ))
 
-            issues_a = [
-                {"type": i.type.name, "severity": i.severity.name, "message": i.message, "matchedText": i.matched_text}
-                for i in validation_a.issues
-            ]
+            try:
+                await push_event("done_a", result_a["unmasked_text"])
+                await push_event("stats_a", {
+                    "finalPromptTokens": result_a["prompt_tokens"],
+                    "finalCompletionTokens": result_a["completion_tokens"],
+                })
 
-            await push_event("done_a", result_a["unmasked_text"])
-            await push_event("validation_a", issues_a)
-            await push_event("stats_a", {
-                "finalPromptTokens": result_a["prompt_tokens"],
-                "finalCompletionTokens": result_a["completion_tokens"],
-            })
+                # ===== AWAIT CUSHION STRATEGY =====
 
-            # ===== AWAIT CUSHION STRATEGY =====
+                cushion_strategy = await cushion_task
+                total_prompt_tokens += cushion_strategy.prompt_tokens
+                total_completion_tokens += cushion_strategy.completion_tokens
 
-            cushion_strategy = await cushion_task
-            total_prompt_tokens += cushion_strategy.prompt_tokens
-            total_completion_tokens += cushion_strategy.completion_tokens
+                if cushion_strategy.strategies:
+                    await push_event("cushionStrategy", {
+                        "overallTone": cushion_strategy.overall_tone,
+                        "strategies": cushion_strategy.strategies,
+                        "transitionNotes": cushion_strategy.transition_notes,
+                    })
 
-            if cushion_strategy.strategies:
-                await push_event("cushionStrategy", {
-                    "overallTone": cushion_strategy.overall_tone,
-                    "strategies": cushion_strategy.strategies,
-                    "transitionNotes": cushion_strategy.transition_notes,
-                })
+                # ===== VARIANT B (cushion-enhanced) =====
 
-            # ===== VARIANT B (cushion-enhanced) =====
+                await push_event("phase", "generating_b")
 
-            await push_event("phase", "generating_b")
-
-            system_prompt_b = _build_system_prompt_with_cushion(
-                template, sections, sa_result, cushion_strategy,
-            )
+                system_prompt_b = _build_system_prompt_with_cushion(
+                    template, sections, sa_result, cushion_strategy,
+                )
 
-            result_b = await _stream_final_model(
-                final_model, system_prompt_b, user_message,
-                spans, final_max_tokens, push_event,
-                thinking_budget=thinking_budget,
-                delta_event_name="delta_b",
-            )
+                result_b = await _stream_final_model(
+                    final_model, system_prompt_b, user_message,
+                    spans, final_max_tokens, push_event,
+                    thinking_budget=thinking_budget,
+                    delta_event_name="delta_b",
+                )
 
-            # Validate B
-            validation_b = output_validator.validate_with_template(
-                result_b["unmasked_text"], original_text, spans,
-                result_b["raw_content"], redaction.redaction_map, yellow_texts,
-                template, sections, enforced,
-            )
+                # Validate B in a worker thread, joined with the in-flight A validation
+                validation_a, validation_b = await asyncio.gather(
+                    validation_a_task,
+                    asyncio.to_thread(
+                        output_validator.validate_with_template,
+                        result_b["unmasked_text"], original_text, spans,
+                        result_b["raw_content"], redaction.redaction_map, yellow_texts,
+                        template, sections, enforced,
+                    ),
+                )
+            finally:
+                # If cushion/B fails, stop awaiting A's validation. Cancelling can't stop the
+                # worker thread (it runs to completion and its result is discarded); this only
+                # keeps the task from being left unawaited ("exception was never retrieved").
+                if not validation_a_task.done():
+                    validation_a_task.cancel()
+                elif not validation_a_task.cancelled():
+                    validation_a_task.exception()
 
+            issues_a = [
+                {"type": i.type.name, "severity": i.severity.name, "message": i.message, "matchedText": i.matched_text}
+                for i in validation_a.issues
+            ]
             issues_b = [
                 {"type": i.type.name, "severity": i.severity.name, "message": i.message, "matchedText": i.matched_text}
                 for i in validation_b.issues
             ]
 
+            await push_event("validation_a", issues_a)
             await push_event("done_b", result_b["unmasked_text"])
             await push_event("validation_b", issues_b)
             await push_event("stats_b", {
@@ -868,7 +918,6 @@ async def stream_text_only_ab(
 
             # Stats
             total_latency = int((time.monotonic() - start_time) * 1000)
-            green_count = sum(1 for s in enforced if s.label.tier == SegmentLabelTier.GREEN)
             yellow_count = redaction.yellow_count
             red_count = redaction.red_count
 
@@ -915,10 +964,10 @@ async def stream_text_only_ab(
             })
 
             # Done with both texts
-            await push_event("done", json.dumps({
+            await push_event("done", {
                 "a": result_a["unmasked_text"],
                 "b": result_b["unmasked_text"],
-            }))
+            })
 
         except AiTransformError as e:
             logger.error("Stream AB transform failed: %s", e)
@@ -931,6 +980,7 @@ async def stream_text_only_ab(
 
     task = asyncio.create_task(run_pipeline())
 
+    event: bytes | None = b""
     try:
         while True:
             event = await queue.get()
@@ -938,11 +988,7 @@ async def stream_text_only_ab(
                 break
             yield event
     finally:
-        if not task.done():
-            try:
-                await task
-            except Exception:
-                pass
+        await _close_pipeline_task(task, queue, finished=event is None)
 
 
 async def _stream_gemini_final_model(
@@ -978,13 +1024,20 @@ async def _stream_gemini_final_model(
     prompt_tokens = 0
     completion_tokens = 0
 
-    async for chunk in stream:
-        if chunk.text:
-            full_content.append(chunk.text)
-            await push_event(delta_event_name, chunk.text)
-        if chunk.usage_metadata:
-            prompt_tokens = chunk.usage_metadata.prompt_token_count or 0
-            completion_tokens = chunk.usage_metadata.candidates_token_count or 0
+    try:
+        async for chunk in stream:
+            if chunk.text:
+                full_content.append(chunk.text)
+                await push_event(delta_event_name, chunk.text)
+            if chunk.usage_metadata:
+                prompt_tokens = chunk.usage_metadata.prompt_token_count or 0
+                completion_tokens = chunk.usage_metadata.candidates_token_count or 0
+            # Stop at the terminal chunk instead of waiting for trailing empty ones
+            if chunk.candidates and chunk.candidates[0].finish_reason:
+                break
+    finally:
+        # Release the connection to the pool right away for the next variant
+        await stream.aclose()
 
     raw_content = "".join(full_content).strip()
     unmask_result = locked_span_masker.unmask(raw_content, locked_spans)
@@ -1020,7 +1073,7 @@ async def _stream_final_model(
             delta_event_name=delta_event_name,
         )
 
-    client = _get_client()
+    client = get_openai_client()
 
     stream = await client.chat.completions.create(
         model=model_name,
@@ -1032,6 +1085,7 @@ async def _stream_final_model(
         ],
         stream=True,
         stream_options={"include_usage": True},
+        extra_body={"prompt_cache_key": prompt_cache_key(system_prompt)},
     )
 
     full_content: list[str] = []
@@ -1,7 +1,11 @@
 """OpenAI API wrapper — AsyncOpenAI + token tracking + error classification."""
 
+import functools
+import hashlib
 import logging
+import re
 
+import httpx
 from openai import AsyncOpenAI
 
 from app.core.config import settings
@@ -17,13 +21,27 @@ class AiTransformError(Exception):
     pass
 
 
-def _get_client() -> AsyncOpenAI:
+def get_openai_client() -> AsyncOpenAI:
     global _client
     if _client is None:
-        _client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # HTTP/2 multiplexes the parallel A/B/cushion fan-out over warm connections
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
+        )
     return _client
 
 
+@functools.lru_cache(maxsize=256)
+def prompt_cache_key(system_prompt: str) -> str:
+    """Stable routing key so calls sharing a system prompt land on the same prompt cache."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
 async def call_openai_with_model(
     model: str,
     system_prompt: str,
@@ -42,7 +60,7 @@ async def call_openai_with_model(
     actual_max_tokens = settings.openai_max_tokens if max_tokens < 0 else max_tokens
 
     try:
-        client = _get_client()
+        client = get_openai_client()
         completion = await client.chat.completions.create(
             model=model,
             temperature=actual_temp,
@@ -51,6 +69,7 @@ async def call_openai_with_model(
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message},
             ],
+            extra_body={"prompt_cache_key": prompt_cache_key(system_prompt)},
         )
 
         prompt_tokens = 0
@@ -89,16 +108,30 @@ async def call_openai_with_model(
         raise AiTransformError(error_msg) from e
 
 
+_ERROR_MATCHERS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (
+        re.compile(r"Unauthorized|401|Incorrect API key"),
+        "AI 서비스 인증 오류: API 키가 유효하지 않습니다. 서버 설정을 확인해주세요.",
+    ),
+    (
+        re.compile(r"RateLimit|429|rate limit"),
+        "AI 서비스 요청 한도 초과: 잠시 후 다시 시도해주세요.",
+    ),
+    (
+        re.compile(r"Timeout|timeout|timed out"),
+        "AI 서비스 응답 시간 초과: 잠시 후 다시 시도해주세요.",
+    ),
+    (
+        re.compile(r"Connect|connect|network"),
+        "AI 서비스 연결 실패: 네트워크 상태를 확인해주세요.",
+    ),
+)
+
+
 def _classify_api_error(e: Exception) -> str:
-    name = type(e).__name__
-    msg = str(e) if str(e) else ""
-
-    if "Unauthorized" in name or "401" in msg or "Incorrect API key" in msg:
-        return "AI 서비스 인증 오류: API 키가 유효하지 않습니다. 서버 설정을 확인해주세요."
-    if "RateLimit" in name or "429" in msg or "rate limit" in msg:
-        return "AI 서비스 요청 한도 초과: 잠시 후 다시 시도해주세요."
-    if "Timeout" in name or "timeout" in msg or "timed out" in msg:
-        return "AI 서비스 응답 시간 초과: 잠시 후 다시 시도해주세요."
-    if "Connect" in name or "connect" in msg or "network" in msg:
-        return "AI 서비스 연결 실패: 네트워크 상태를 확인해주세요."
+    # Exception class name and message are matched together, first hit wins
+    text = f"{type(e).__name__} {e}"
+    for pattern, message in _ERROR_MATCHERS:
+        if pattern.search(text):
+            return message
     return "AI 변환 서비스에 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
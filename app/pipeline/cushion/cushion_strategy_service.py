@@ -7,10 +7,11 @@ Model: gemini-2.5-flash-lite, temp=0.3, per-segment max_tokens=800 (incl. 512 th
 """
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 
+import orjson
+
 from app.core.config import settings
 from app.models.domain import LabeledSegment
 from app.models.enums import SegmentLabelTier
@@ -78,7 +79,7 @@ _PER_SEGMENT_SYSTEM_PROMPT = """\
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CushionStrategy:
     raw_json: str
     overall_tone: str
@@ -99,7 +100,8 @@ _REQUIRED_KEYS = {"segment_id", "label", "approach", "cushion_phrase", "avoid"}
 def _build_per_segment_user_message(
     sa_result: SituationAnalysisResult,
     target_segment: LabeledSegment,
-    all_segments: list[LabeledSegment],
+    sorted_segs: list[LabeledSegment],
+    idx_of: dict[str, int],
     sender_info: str | None,
 ) -> str:
     parts: list[str] = []
@@ -120,11 +122,7 @@ def _build_per_segment_user_message(
     parts.append(f"- {target_segment.segment_id} | {target_segment.label.name} | {target_segment.text}\n\n")
 
     # Adjacent segments for context (1 before, 1 after)
-    sorted_segs = sorted(all_segments, key=lambda s: s.start)
-    target_idx = next(
-        (i for i, s in enumerate(sorted_segs) if s.segment_id == target_segment.segment_id),
-        None,
-    )
+    target_idx = idx_of.get(target_segment.segment_id)
     if target_idx is not None:
         neighbors: list[LabeledSegment] = []
         if target_idx > 0:
@@ -145,7 +143,7 @@ def _build_per_segment_user_message(
 # ---------------------------------------------------------------------------
 # Single-YELLOW LLM call
 # ---------------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SingleResult:
     strategy: dict
     prompt_tokens: int
@@ -155,20 +153,21 @@ class _SingleResult:
 async def _generate_single(
     sa_result: SituationAnalysisResult,
     target_segment: LabeledSegment,
-    all_segments: list[LabeledSegment],
+    sorted_segs: list[LabeledSegment],
+    idx_of: dict[str, int],
     sender_info: str | None,
     ai_call_fn,
 ) -> _SingleResult | None:
     """Call LLM for one YELLOW segment. Returns result or None on failure."""
     user_message = _build_per_segment_user_message(
-        sa_result, target_segment, all_segments, sender_info,
+        sa_result, target_segment, sorted_segs, idx_of, sender_info,
     )
 
     try:
         result = await ai_call_fn(
             MODEL, _PER_SEGMENT_SYSTEM_PROMPT, user_message,
             TEMPERATURE, _PER_SEGMENT_MAX_TOKENS, None,
-            thinking_budget=THINKING_BUDGET,
+            thinking_budget=THINKING_BUDGET, cacheable=True,
         )
 
         raw = result.content.strip()
@@ -178,7 +177,7 @@ async def _generate_single(
             if raw.endswith("```"):
                 raw = raw[:-3].strip()
 
-        parsed = json.loads(raw)
+        parsed = orjson.loads(raw)
 
         # Validate required keys
         missing = _REQUIRED_KEYS - set(parsed.keys())
@@ -265,9 +264,21 @@ async def generate(
         logger.info("[CushionStrategy] No YELLOW segments, skipping")
         return _EMPTY
 
+    # Sort once for neighbor lookup across all per-segment calls
+    sorted_segs = sorted(labeled_segments, key=lambda s: s.start)
+    idx_of = {s.segment_id: i for i, s in enumerate(sorted_segs)}
+
+    # Single YELLOW (common case) — await directly, no gather/task overhead
+    if len(yellow_segments) == 1:
+        r = await _generate_single(sa_result, yellow_segments[0], sorted_segs, idx_of, sender_info, ai_call_fn)
+        if r is None:
+            logger.warning("[CushionStrategy] Single per-segment call failed, returning empty")
+            return _EMPTY
+        return _build_result([r.strategy], r.prompt_tokens, r.completion_tokens, 1)
+
     # Launch parallel LLM calls — one per YELLOW segment
     tasks = [
-        _generate_single(sa_result, seg, labeled_segments, sender_info, ai_call_fn)
+        _generate_single(sa_result, seg, sorted_segs, idx_of, sender_info, ai_call_fn)
         for seg in yellow_segments
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -289,17 +300,26 @@ async def generate(
         logger.warning("[CushionStrategy] All per-segment calls failed, returning empty")
         return _EMPTY
 
+    return _build_result(strategies, total_prompt, total_completion, len(yellow_segments))
+
+
+def _build_result(
+    strategies: list[dict],
+    total_prompt: int,
+    total_completion: int,
+    yellow_count: int,
+) -> CushionStrategy:
+    """Assemble the merged CushionStrategy (tone, transition notes, raw JSON)."""
     overall_tone = _derive_overall_tone(strategies)
     transition_notes = _derive_transition_notes(strategies)
 
-    raw_json = json.dumps(
+    raw_json = orjson.dumps(
         {"overall_tone": overall_tone, "strategies": strategies, "transition_notes": transition_notes},
-        ensure_ascii=False,
-    )
+    ).decode()
 
     logger.info(
         "[CushionStrategy] Generated %d/%d strategies",
-        len(strategies), len(yellow_segments),
+        len(strategies), yellow_count,
     )
 
     return CushionStrategy(
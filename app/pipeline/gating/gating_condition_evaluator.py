@@ -24,5 +24,5 @@ def should_fire_identity_booster(
 
 def should_fire_situation_analysis(text: str) -> bool:
     """Situation Analysis: always ON."""
-    logger.info("[Gating] SituationAnalysis: ON (always-on)")
+    logger.debug("[Gating] SituationAnalysis: ON (always-on)")
     return True
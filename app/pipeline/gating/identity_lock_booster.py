@@ -3,6 +3,9 @@
 Extracts proper nouns, filenames, etc. that regex patterns cannot catch.
 """
 
+import bisect
+import functools
+import itertools
 import logging
 import re
 from dataclasses import dataclass
@@ -45,7 +48,7 @@ SYSTEM_PROMPT = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoosterResult:
     extra_spans: list[LockedSpan]  # newly found SEMANTIC spans only
     prompt_tokens: int
@@ -67,7 +70,7 @@ async def boost(
 
     result: LlmCallResult = await ai_call_fn(
         MODEL, SYSTEM_PROMPT, user_message, TEMPERATURE, MAX_TOKENS, None,
-        thinking_budget=THINKING_BUDGET,
+        thinking_budget=THINKING_BUDGET, cacheable=True,
     )
 
     new_spans = _parse_semantic_spans(normalized_text, current_spans, result.content)
@@ -78,6 +81,10 @@ async def boost(
     return BoosterResult(new_spans, result.prompt_tokens, result.completion_tokens)
 
 
+# "- span" lines; [^\S\n] is whitespace that never crosses a line break
+_SPAN_LINE_PATTERN = re.compile(r"^[^\S\n]*- [^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+
 def _parse_semantic_spans(
     normalized_text: str,
     existing_spans: list[LockedSpan],
@@ -87,30 +94,29 @@ def _parse_semantic_spans(
     if not output or not output.strip() or output.strip() == "없음":
         return result
 
-    all_known_spans = list(existing_spans)
+    # Known spans never overlap, so sorted starts/ends allow a bisect overlap check
+    known = sorted((s.start_pos, s.end_pos) for s in existing_spans)
+    known_starts = [start for start, _ in known]
+    known_ends = [end for _, end in known]
     next_index = len(existing_spans)
+    prefix = LockedSpanType.SEMANTIC.placeholder_prefix
 
-    for line in output.split("\n"):
-        line = line.strip()
-        if not line.startswith("- "):
-            continue
-
-        text = line[2:].strip()
-        if not text or len(text) < 2:
+    for text in _SPAN_LINE_PATTERN.findall(output):
+        if len(text) < 2:
             continue
 
         # Use word-boundary-aware search
         span_pattern = _build_word_boundary_pattern(text)
         for m in span_pattern.finditer(normalized_text):
-            pos = m.start()
-            end_pos = m.end()
+            pos, end_pos = m.span()
 
-            # Check overlap
-            overlaps = any(pos < s.end_pos and end_pos > s.start_pos for s in all_known_spans)
-            if overlaps:
+            # Check overlap against the nearest known span on each side
+            i = bisect.bisect_right(known_starts, pos)
+            if i > 0 and known_ends[i - 1] > pos:
+                continue
+            if i < len(known_starts) and known_starts[i] < end_pos:
                 continue
 
-            prefix = LockedSpanType.SEMANTIC.placeholder_prefix
             new_span = LockedSpan(
                 index=next_index,
                 original_text=text,
@@ -120,12 +126,14 @@ def _parse_semantic_spans(
                 end_pos=end_pos,
             )
             result.append(new_span)
-            all_known_spans.append(new_span)
+            known_starts.insert(i, pos)
+            known_ends.insert(i, end_pos)
             next_index += 1
 
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def _build_word_boundary_pattern(text: str) -> re.Pattern:
     """Build a word-boundary-aware pattern for the given text."""
     quoted = re.escape(text)
@@ -138,10 +146,15 @@ def _build_word_boundary_pattern(text: str) -> re.Pattern:
     return re.compile(prefix + quoted + suffix)
 
 
-def _is_korean_char(c: str) -> bool:
-    code = ord(c)
-    return (
-        (0xAC00 <= code <= 0xD7A3)  # 한글 음절
-        or (0x3131 <= code <= 0x314E)  # 자음
-        or (0x314F <= code <= 0x3163)  # 모음
+_KOREAN_CHARS = frozenset(
+    chr(code)
+    for code in itertools.chain(
+        range(0xAC00, 0xD7A4),  # 한글 음절
+        range(0x3131, 0x314F),  # 자음
+        range(0x314F, 0x3164),  # 모음
     )
+)
+
+
+def _is_korean_char(c: str) -> bool:
+    return c in _KOREAN_CHARS
@@ -4,11 +4,13 @@ Outputs structured JSON (facts + intent).
 Provides Final model with accurate context to reduce hallucination.
 """
 
-import json
+import functools
 import logging
 import re
 from dataclasses import dataclass
 
+import orjson
+
 from app.models.domain import LabeledSegment, LlmCallResult
 from app.models.enums import SegmentLabelTier
 
@@ -19,19 +21,20 @@ TEMPERATURE = 0.2
 MAX_TOKENS = 650
 
 _KOREAN_WORD_PATTERN = re.compile(r"[가-힣]{2,}")
+_NON_MATCH_CHAR_PATTERN = re.compile(r"[^가-힣a-zA-Z0-9]+")
 _STOPWORDS = frozenset({
     "그리고", "하지만", "그래서", "때문에", "그런데", "그러나", "또한", "이런", "저런", "그런",
     "이것", "저것", "그것", "여기", "거기", "저기", "우리", "너희", "이번", "다음",
 })
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fact:
     content: str
     source: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SituationAnalysisResult:
     facts: list[Fact]
     intent: str
@@ -71,11 +74,14 @@ async def analyze_text_only(
     user_prompt: str | None = None,
 ) -> SituationAnalysisResult:
     """Run text-only situation analysis (facts + intent only)."""
+    sender = (sender_info or "").strip()
+    extra = (user_prompt or "").strip()
+
     parts: list[str] = []
-    if sender_info and sender_info.strip():
-        parts.append(f"보내는 사람: {sender_info}")
-    if user_prompt and user_prompt.strip():
-        parts.append(f"추가 정보: {user_prompt}")
+    if sender:
+        parts.append(f"보내는 사람: {sender}")
+    if extra:
+        parts.append(f"추가 정보: {extra}")
     parts.append(f"\n원문:\n{masked_text}")
 
     user_message = "\n".join(parts)
@@ -83,6 +89,7 @@ async def analyze_text_only(
     try:
         result: LlmCallResult = await ai_call_fn(
             MODEL, SYSTEM_PROMPT_TEXT_ONLY, user_message, TEMPERATURE, MAX_TOKENS, None,
+            cacheable=True,
         )
         return _parse_result_text_only(result)
     except Exception as e:
@@ -107,50 +114,32 @@ def filter_red_facts(
     if not red_segments:
         return original
 
+    # Per-RED-segment match keys, computed once instead of once per fact
+    red_texts = [red.text for red in red_segments]
+    red_normalized = [_normalize_for_match(text) for text in red_texts]
+
+    # Duplicate sources get the same verdict, so each distinct source is matched once
+    reasons: dict[str, str | None] = {}
     filtered_facts: list[Fact] = []
     for fact in original.facts:
         if not fact.source or not fact.source.strip():
             filtered_facts.append(fact)
             continue
 
-        # Strategy 1: Exact indexOf with position-based overlap
-        fact_start = masked_text.find(fact.source)
-        if fact_start >= 0:
-            fact_end = fact_start + len(fact.source)
-            overlaps_red = any(
-                fact_start < red.end and fact_end > red.start
-                for red in red_segments
+        if fact.source not in reasons:
+            reasons[fact.source] = _red_overlap_reason(
+                fact.source, masked_text, red_segments, red_texts, red_normalized,
             )
-            if overlaps_red:
-                logger.info("[SituationAnalysis] Filtered RED-overlapping fact (exact): %s", fact.content)
-                continue
-            filtered_facts.append(fact)
+        reason = reasons[fact.source]
+        if reason is not None:
+            logger.info("[SituationAnalysis] Filtered RED-overlapping fact (%s): %s", reason, fact.content)
             continue
 
-        # Strategy 2: Normalized contains
-        normalized_source = _normalize_for_match(fact.source)
-        if normalized_source:
-            normalized_match = any(
-                normalized_source in _normalize_for_match(red.text)
-                for red in red_segments
-            )
-            if normalized_match:
-                logger.info("[SituationAnalysis] Filtered RED-overlapping fact (normalized): %s", fact.content)
-                continue
-
-        # Strategy 3: Semantic word overlap
-        source_words = _extract_meaning_words(fact.source)
-        if len(source_words) >= 2:
-            semantic_match = any(
-                sum(1 for w in source_words if w in red.text) >= 2
-                for red in red_segments
-            )
-            if semantic_match:
-                logger.info("[SituationAnalysis] Filtered RED-overlapping fact (semantic): %s", fact.content)
-                continue
-
         filtered_facts.append(fact)
 
+    if len(filtered_facts) == len(original.facts):
+        return original
+
     return SituationAnalysisResult(
         facts=filtered_facts,
         intent=original.intent,
@@ -159,44 +148,84 @@ def filter_red_facts(
     )
 
 
+def _red_overlap_reason(
+    source: str,
+    masked_text: str,
+    red_segments: list[LabeledSegment],
+    red_texts: list[str],
+    red_normalized: list[str],
+) -> str | None:
+    """Return which strategy matched the source against a RED segment, or None."""
+    # Strategy 1: Exact indexOf with position-based overlap
+    fact_start = masked_text.find(source)
+    if fact_start >= 0:
+        fact_end = fact_start + len(source)
+        overlaps_red = any(
+            fact_start < red.end and fact_end > red.start
+            for red in red_segments
+        )
+        return "exact" if overlaps_red else None
+
+    # Strategy 2: Normalized contains
+    normalized_source = _normalize_for_match(source)
+    if normalized_source and any(normalized_source in red_norm for red_norm in red_normalized):
+        return "normalized"
+
+    # Strategy 3: Semantic word overlap
+    source_words = _extract_meaning_words(source)
+    if len(source_words) >= 2 and any(
+        sum(1 for w in source_words if w in red_text) >= 2
+        for red_text in red_texts
+    ):
+        return "semantic"
+
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
 def _normalize_for_match(text: str) -> str:
-    return re.sub(r"[^가-힣a-zA-Z0-9]", "", text).lower()
+    return _NON_MATCH_CHAR_PATTERN.sub("", text).lower()
 
 
-def _extract_meaning_words(text: str) -> list[str]:
-    words: list[str] = []
-    for m in _KOREAN_WORD_PATTERN.finditer(text):
-        word = m.group()
-        if word not in _STOPWORDS:
-            words.append(word)
-    return words
+@functools.lru_cache(maxsize=2048)
+def _extract_meaning_words(text: str) -> tuple[str, ...]:
+    return tuple(word for word in _KOREAN_WORD_PATTERN.findall(text) if word not in _STOPWORDS)
 
 
 def _parse_result_text_only(result: LlmCallResult) -> SituationAnalysisResult:
     """Parse text-only SA response (facts + intent only)."""
     try:
-        root = json.loads(result.content)
-
-        facts: list[Fact] = []
-        for fact_node in root.get("facts", []):
-            content = fact_node.get("content", "")
-            source = fact_node.get("source", "")
-            if content:
-                facts.append(Fact(content=content, source=source))
-
-        intent = root.get("intent", "")
-
-        return SituationAnalysisResult(
-            facts=facts,
-            intent=intent,
-            prompt_tokens=result.prompt_tokens,
-            completion_tokens=result.completion_tokens,
-        )
-    except Exception as e:
+        root = orjson.loads(result.content)
+    except orjson.JSONDecodeError as e:
         logger.warning("[SituationAnalysis] Text-only parse failed: %s", e)
+        root = None
+
+    if not isinstance(root, dict):
         return SituationAnalysisResult(
             facts=[],
             intent="",
             prompt_tokens=result.prompt_tokens,
             completion_tokens=result.completion_tokens,
         )
+
+    facts: list[Fact] = []
+    fact_nodes = root.get("facts")
+    if isinstance(fact_nodes, list):
+        for fact_node in fact_nodes:
+            if not isinstance(fact_node, dict):
+                continue
+            content = fact_node.get("content", "")
+            source = fact_node.get("source", "")
+            if not isinstance(content, str) or not isinstance(source, str):
+                continue
+            if content:
+                facts.append(Fact(content=content, source=source))
+
+    intent = root.get("intent", "")
+
+    return SituationAnalysisResult(
+        facts=facts,
+        intent=intent if isinstance(intent, str) else "",
+        prompt_tokens=result.prompt_tokens,
+        completion_tokens=result.completion_tokens,
+    )
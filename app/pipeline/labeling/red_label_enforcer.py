@@ -20,17 +20,32 @@ logger = logging.getLogger(__name__)
 # Profanity/slurs (matched against normalized text) → AGGRESSION
 _PROFANITY = re.compile(r"ㅅㅂ|ㅄ|ㅂㅅ|ㄱㅅㄲ|시발|씨발|병신|개새끼|개세끼|지랄|ㅈㄹ|ㅂㄹ")
 
-# Direct ability denial → PERSONAL_ATTACK
-_ABILITY_DENIAL = re.compile(r"그것도\s*못|뇌가\s*있|할\s*줄\s*모르|그것도\s*몰라|무능")
-
-# Sarcastic praise + marker (ㅋㅎ^) → AGGRESSION
-_MOCKERY_CERTAIN = re.compile(r"(?:잘|대단|훌륭)\S{0,4}(?:시네요|하시네요|십니다)\s*[ㅋㅎ^]{2,}")
+# Raw-text patterns, scanned in one pass:
+# - Sarcastic praise + marker (ㅋㅎ^) → AGGRESSION
+# - Direct ability denial → PERSONAL_ATTACK
+# The alternatives start with disjoint characters, so neither can shadow a match of the other.
+_RAW_CONFIRMED = re.compile(
+    r"(?P<AGGRESSION>(?:잘|대단|훌륭)\S{0,4}(?:시네요|하시네요|십니다)\s*[ㅋㅎ^]{2,})"
+    r"|(?P<PERSONAL_ATTACK>그것도\s*못|뇌가\s*있|할\s*줄\s*모르|그것도\s*몰라|무능)"
+)
 
 # === Ambiguous patterns: GREEN→YELLOW only ===
 
 # Context-dependent expressions (e.g., "미친" can be exclamation or insult)
 _SOFT_PROFANITY = re.compile(r"미친|개같|ㅈㄴ")
 
+# First characters of every normalized-text alternative (both patterns are plain literal
+# alternations). Normalization only deletes characters, so a segment containing none of
+# these can match neither pattern and skips normalization entirely.
+_NORMALIZED_TRIGGERS = frozenset(
+    alt[0] for pattern in (_PROFANITY, _SOFT_PROFANITY) for alt in pattern.pattern.split("|")
+)
+
+# Lead characters of the _RAW_CONFIRMED alternatives (잘/대단/훌륭, 그것도/뇌가/할/무능).
+# A segment with none of these and none of _NORMALIZED_TRIGGERS cannot match any rule.
+_RAW_TRIGGERS = frozenset("잘대훌그뇌할무")
+_ALL_TRIGGERS = _NORMALIZED_TRIGGERS | _RAW_TRIGGERS
+
 _NORMALIZE_RE = re.compile(r"[\s\-_.·!@#$%^&*()]+")
 
 
@@ -53,28 +68,33 @@ def enforce(labeled: list[LabeledSegment]) -> list[LabeledSegment]:
             continue
 
         text = ls.text
-        normalized = _normalize(text)
-
-        # Confirmed: profanity or mockery → AGGRESSION
-        if _PROFANITY.search(normalized) or _MOCKERY_CERTAIN.search(text):
-            logger.info(
-                "[RedLabelEnforcer] Confirmed override %s → AGGRESSION (segment %s)",
-                ls.label, ls.segment_id,
-            )
-            result.append(LabeledSegment(ls.segment_id, SegmentLabel.AGGRESSION, ls.text, ls.start, ls.end))
+        if _ALL_TRIGGERS.isdisjoint(text):
+            result.append(ls)
             continue
 
-        # Confirmed: ability denial → PERSONAL_ATTACK
-        if _ABILITY_DENIAL.search(text):
+        normalized = None if _NORMALIZED_TRIGGERS.isdisjoint(text) else _normalize(text)
+
+        # Confirmed: profanity or mockery → AGGRESSION, ability denial → PERSONAL_ATTACK
+        # (AGGRESSION wins when both appear)
+        confirmed: SegmentLabel | None = (
+            SegmentLabel.AGGRESSION if normalized and _PROFANITY.search(normalized) else None
+        )
+        if confirmed is None:
+            for m in _RAW_CONFIRMED.finditer(text):
+                confirmed = SegmentLabel[m.lastgroup]
+                if confirmed is SegmentLabel.AGGRESSION:
+                    break
+
+        if confirmed is not None:
             logger.info(
-                "[RedLabelEnforcer] Confirmed override %s → PERSONAL_ATTACK (segment %s)",
-                ls.label, ls.segment_id,
+                "[RedLabelEnforcer] Confirmed override %s → %s (segment %s)",
+                ls.label, confirmed.value, ls.segment_id,
             )
-            result.append(LabeledSegment(ls.segment_id, SegmentLabel.PERSONAL_ATTACK, ls.text, ls.start, ls.end))
+            result.append(LabeledSegment(ls.segment_id, confirmed, ls.text, ls.start, ls.end))
             continue
 
         # Ambiguous: soft profanity — GREEN→YELLOW upgrade only
-        if ls.label.tier == SegmentLabelTier.GREEN and _SOFT_PROFANITY.search(normalized):
+        if normalized and ls.label.tier == SegmentLabelTier.GREEN and _SOFT_PROFANITY.search(normalized):
             logger.info(
                 "[RedLabelEnforcer] Soft upgrade %s → EMOTIONAL (segment %s)",
                 ls.label, ls.segment_id,
@@ -9,7 +9,7 @@ YELLOW uses hard/soft trigger judgment instead of "polite conversion test".
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from app.core.config import settings
 from app.models.domain import LabeledSegment, LlmCallResult, Segment
@@ -34,6 +34,17 @@ _MIGRATION_MAP: dict[str, SegmentLabel] = {
     "OVER_EXPLANATION": SegmentLabel.EXCESS_DETAIL,
 }
 
+# Single lookup for current labels and migrated legacy names
+_LABEL_LOOKUP: dict[str, SegmentLabel] = {
+    **{label.value: label for label in SegmentLabel},
+    **_MIGRATION_MAP,
+}
+
+# At least one of these must be present for a labeling result to be accepted
+_CORE_GREEN_LABELS: frozenset[SegmentLabel] = frozenset({
+    SegmentLabel.CORE_FACT, SegmentLabel.CORE_INTENT, SegmentLabel.REQUEST,
+})
+
 
 @dataclass(frozen=True)
 class StructureLabelResult:
@@ -264,22 +275,22 @@ async def label_text_only(
     contains only the segment list and masked text (no persona/contexts/tone).
     """
     user_message = _build_user_message_text_only(segments, masked_text)
+    segment_map = {seg.id: seg for seg in segments}
 
     result: LlmCallResult = await ai_call_fn(
         PRIMARY_MODEL, SYSTEM_PROMPT, user_message, TEMPERATURE, MAX_TOKENS, None,
-        thinking_budget=THINKING_BUDGET,
+        thinking_budget=THINKING_BUDGET, cacheable=True,
     )
 
     logger.debug("[StructureLabel] Text-only raw LLM response:\n%s", result.content)
 
-    labeled = _parse_output(result.content, masked_text, segments)
-    summary = _parse_summary(result.content)
+    labeled, summary, nongreen_count = _parse_content(result.content, segment_map)
 
     total_prompt = result.prompt_tokens
     total_completion = result.completion_tokens
 
     # Validate coverage
-    if not _validate_result(labeled, masked_text, segments):
+    if not _validate_result(labeled, len(segments)):
         labeled_ids = {ls.segment_id for ls in labeled}
         missing_ids = [seg.id for seg in segments if seg.id not in labeled_ids]
 
@@ -297,18 +308,17 @@ async def label_text_only(
         )
         retry_result: LlmCallResult = await ai_call_fn(
             PRIMARY_MODEL, SYSTEM_PROMPT, retry_message, TEMPERATURE, MAX_TOKENS, None,
-            thinking_budget=THINKING_BUDGET,
+            thinking_budget=THINKING_BUDGET, cacheable=True,
         )
 
         logger.debug("[StructureLabel] Text-only retry raw LLM response:\n%s", retry_result.content)
 
-        retry_labeled = _parse_output(retry_result.content, masked_text, segments)
-        retry_summary = _parse_summary(retry_result.content)
+        retry_labeled, retry_summary, _ = _parse_content(retry_result.content, segment_map)
         total_prompt += retry_result.prompt_tokens
         total_completion += retry_result.completion_tokens
 
         if retry_labeled:
-            retry_labeled = _fill_missing_labels(retry_labeled, segments)
+            retry_labeled = _fill_missing_labels(retry_labeled, segment_map)
             return StructureLabelResult(retry_labeled, retry_summary, total_prompt, total_completion)
 
         # Both attempts failed — fallback: label all as COURTESY
@@ -323,7 +333,7 @@ async def label_text_only(
         return StructureLabelResult(fallback, retry_summary, total_prompt, total_completion)
 
     # All-GREEN recovery (same logic as label())
-    if len(segments) >= 4 and _is_all_green(labeled):
+    if len(segments) >= 4 and nongreen_count == 0:
         logger.warning(
             "[StructureLabel] Text-only all %d segments labeled GREEN — trying yellow scanner first",
             len(labeled),
@@ -340,11 +350,11 @@ async def label_text_only(
             )
             upgraded_map = {u.segment_id: u.new_label for u in upgrades}
             upgraded_labeled = [
-                LabeledSegment(ls.segment_id, upgraded_map[ls.segment_id], ls.text, ls.start, ls.end)
+                replace(ls, label=upgraded_map[ls.segment_id])
                 if ls.segment_id in upgraded_map else ls
                 for ls in labeled
             ]
-            upgraded_labeled = _fill_missing_labels(upgraded_labeled, segments)
+            upgraded_labeled = _fill_missing_labels(upgraded_labeled, segment_map)
             return StructureLabelResult(
                 upgraded_labeled, summary, total_prompt, total_completion,
                 yellow_recovery_applied=True,
@@ -358,19 +368,18 @@ async def label_text_only(
         )
         fallback_result: LlmCallResult = await ai_call_fn(
             FALLBACK_MODEL, SYSTEM_PROMPT, user_message, TEMPERATURE, MAX_TOKENS, None,
+            cacheable=True,
         )
 
         logger.debug("[StructureLabel] Text-only fallback model response:\n%s", fallback_result.content)
 
-        fallback_labeled = _parse_output(fallback_result.content, masked_text, segments)
-        fallback_summary = _parse_summary(fallback_result.content)
+        fallback_labeled, fallback_summary, fallback_nongreen = _parse_content(fallback_result.content, segment_map)
         total_prompt += fallback_result.prompt_tokens
         total_completion += fallback_result.completion_tokens
 
         if fallback_labeled:
-            has_non_green = any(s.label.tier != SegmentLabelTier.GREEN for s in fallback_labeled)
-            if has_non_green:
-                fallback_labeled = _fill_missing_from_original(fallback_labeled, labeled, segments)
+            if fallback_nongreen:
+                fallback_labeled = _fill_missing_from_original(fallback_labeled, labeled, segment_map)
                 return StructureLabelResult(
                     fallback_labeled,
                     fallback_summary if fallback_summary else summary,
@@ -378,60 +387,56 @@ async def label_text_only(
                 )
         logger.info("[StructureLabel] Text-only fallback model also all-GREEN — accepting original result")
 
-    labeled = _fill_missing_labels(labeled, segments)
+    labeled = _fill_missing_labels(labeled, segment_map)
     return StructureLabelResult(labeled, summary, total_prompt, total_completion)
 
 
-def _is_all_green(labeled: list[LabeledSegment]) -> bool:
-    return all(s.label.tier == SegmentLabelTier.GREEN for s in labeled)
-
+# Fenced response: drop the opening ```lang line and an optional closing fence
+_CODE_BLOCK_PATTERN = re.compile(r"```[^\n]*\n(.*?)(?:```)?\Z", re.DOTALL)
 
-_ENTRY_PATTERN = re.compile(r"\*\*")
 
+def _parse_content(
+    output: str, segment_map: dict[str, Segment],
+) -> tuple[list[LabeledSegment], str | None, int]:
+    """Parse LLM output in one pass: SEG_ID|LABEL lines (2-column format) + optional SUMMARY line.
 
-def _parse_output(output: str, masked_text: str, segments: list[Segment]) -> list[LabeledSegment]:
-    """Parse LLM output lines: SEG_ID|LABEL (2-column format)."""
+    Also returns the number of parsed labels outside the GREEN tier.
+    """
     result: list[LabeledSegment] = []
+    summary: str | None = None
+    nongreen_count = 0
     if not output or not output.strip():
-        return result
-
-    # Build segment lookup map
-    segment_map = {seg.id: seg for seg in segments}
+        return result, summary, nongreen_count
 
     # Track seen segment IDs to deduplicate
     seen_seg_ids: set[str] = set()
 
     # Strip markdown code blocks
     cleaned = output.strip()
-    if cleaned.startswith("```"):
-        first_newline = cleaned.find("\n")
-        if first_newline > 0:
-            cleaned = cleaned[first_newline + 1:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
-
-    for line in cleaned.split("\n"):
+    m = _CODE_BLOCK_PATTERN.match(cleaned)
+    if m:
+        cleaned = m.group(1).strip()
+
+    for line in cleaned.splitlines():
         line = line.strip()
         if line.startswith("SUMMARY:"):
+            if summary is None:
+                summary = line[len("SUMMARY:"):].strip()
             continue
         if not line:
             continue
         if line.startswith("```") or line.startswith("#") or line.startswith("---"):
             continue
-        if "|" not in line:
-            continue
-
-        parts = line.split("|", 2)
-        if len(parts) < 2:
+        raw_seg_id, sep, rest = line.partition("|")
+        if not sep:
             continue
 
-        raw_seg_id = parts[0].strip()
-        label_str = parts[1].strip()
+        raw_seg_id = raw_seg_id.strip()
+        label_str = rest.partition("|")[0].strip()
 
         # Normalize segId: strip markdown bold (**T1** → T1), leading dash/bullet
         seg_id = raw_seg_id.replace("**", "")
-        seg_id = re.sub(r"^[-•*]\s*", "", seg_id).strip()
+        seg_id = seg_id.lstrip("-•*").strip()
 
         # Deduplicate
         if seg_id in seen_seg_ids:
@@ -447,45 +452,33 @@ def _parse_output(output: str, masked_text: str, segments: list[Segment]) -> lis
 
         # Resolve label
         label = _resolve_label(label_str, seg_id)
+        if label.tier != SegmentLabelTier.GREEN:
+            nongreen_count += 1
         result.append(LabeledSegment(seg_id, label, seg.text, seg.start, seg.end))
 
-    return result
+    return result, summary, nongreen_count
 
 
 def _resolve_label(label_str: str, seg_id: str) -> SegmentLabel:
     """Resolve a label string to a SegmentLabel enum value."""
-    # 1. Try direct lookup
-    try:
-        return SegmentLabel(label_str)
-    except ValueError:
-        pass
-
-    # 2. Try migration map
-    migrated = _MIGRATION_MAP.get(label_str)
-    if migrated is not None:
-        logger.warning("[StructureLabel] Migrated old label '%s' → '%s' for segment %s", label_str, migrated, seg_id)
-        return migrated
-
-    # 3. Unknown label — default to COURTESY
+    label = _LABEL_LOOKUP.get(label_str)
+    if label is not None:
+        if label.value != label_str:
+            logger.warning("[StructureLabel] Migrated old label '%s' → '%s' for segment %s", label_str, label, seg_id)
+        return label
+
+    # Unknown label — default to COURTESY
     logger.warning("[StructureLabel] Unknown label '%s' for segment %s, defaulting to COURTESY", label_str, seg_id)
     return SegmentLabel.COURTESY
 
 
-def _parse_summary(output: str) -> str | None:
-    if not output:
-        return None
-    for line in output.split("\n"):
-        line = line.strip()
-        if line.startswith("SUMMARY:"):
-            return line[len("SUMMARY:"):].strip()
-    return None
-
-
-def _fill_missing_labels(labeled: list[LabeledSegment], segments: list[Segment]) -> list[LabeledSegment]:
+def _fill_missing_labels(
+    labeled: list[LabeledSegment], segment_map: dict[str, Segment],
+) -> list[LabeledSegment]:
     labeled_ids = {ls.segment_id for ls in labeled}
     missing = [
         LabeledSegment(seg.id, SegmentLabel.COURTESY, seg.text, seg.start, seg.end)
-        for seg in segments
+        for seg in segment_map.values()
         if seg.id not in labeled_ids
     ]
     if missing:
@@ -500,13 +493,13 @@ def _fill_missing_labels(labeled: list[LabeledSegment], segments: list[Segment])
 def _fill_missing_from_original(
     diversity_labeled: list[LabeledSegment],
     original_labeled: list[LabeledSegment],
-    segments: list[Segment],
+    segment_map: dict[str, Segment],
 ) -> list[LabeledSegment]:
     diversity_ids = {ls.segment_id for ls in diversity_labeled}
     original_map = {ls.segment_id: ls for ls in original_labeled}
 
     combined = list(diversity_labeled)
-    for seg in segments:
+    for seg in segment_map.values():
         if seg.id not in diversity_ids:
             original = original_map.get(seg.id)
             if original is not None:
@@ -531,24 +524,21 @@ def _build_user_message_text_only(
     return "\n".join(parts)
 
 
-def _validate_result(labeled: list[LabeledSegment], masked_text: str, segments: list[Segment]) -> bool:
+def _validate_result(labeled: list[LabeledSegment], segment_count: int) -> bool:
     if not labeled:
         return False
-    if not segments:
+    if not segment_count:
         return False
 
-    coverage = len(labeled) / len(segments)
+    coverage = len(labeled) / segment_count
     if coverage < MIN_COVERAGE:
         logger.warning(
             "[StructureLabel] Low segment coverage: %d of %d (%d%%, min: %d%%)",
-            len(labeled), len(segments), round(coverage * 100), round(MIN_COVERAGE * 100),
+            len(labeled), segment_count, round(coverage * 100), round(MIN_COVERAGE * 100),
         )
         return False
 
-    has_core_green = any(
-        s.label in (SegmentLabel.CORE_FACT, SegmentLabel.CORE_INTENT, SegmentLabel.REQUEST)
-        for s in labeled
-    )
+    has_core_green = any(s.label in _CORE_GREEN_LABELS for s in labeled)
     if not has_core_green:
         logger.warning("[StructureLabel] No CORE_FACT, CORE_INTENT, or REQUEST found")
         return False
@@ -12,6 +12,7 @@ avoiding an expensive LLM diversity retry.
   4. Defensive structure ("내 탓 하려는"/"말해두는데"/"난 ~했고")
 """
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -34,52 +35,34 @@ class YellowUpgrade:
 # Pattern definitions
 # ---------------------------------------------------------------------------
 
-# Each category: (recommended_label, strong_patterns (+2), soft_patterns (+1))
-_CategoryDef = tuple[SegmentLabel, list[re.Pattern], list[re.Pattern]]
-
 _RECIPIENT_RE = re.compile(r"(?:상대|님|너희|귀사|담당)")
 _GENERALIZER_RE = re.compile(r"(?:매번|맨날|항상|도대체)")
 
-_CATEGORIES: list[tuple[str, _CategoryDef]] = [
-    # 1. Blame + generalization
-    (
-        "blame_generalization",
-        (
-            SegmentLabel.ACCOUNTABILITY,
-            # Strong: generalizer + recipient reference in same segment
-            [],  # handled via compound check below
-            # Soft: generalizer alone
-            [],  # handled via compound check below
-        ),
-    ),
+# Categories 2-4: (name, recommended_label, strong_pattern (+2), soft_pattern (+1)).
+# Category 1 (blame + generalization) needs a compound check — see _score_blame_generalization.
+_CATEGORIES: tuple[tuple[str, SegmentLabel, re.Pattern, re.Pattern], ...] = (
     # 2. Direct emotional expression
     (
         "emotional_expression",
-        (
-            SegmentLabel.EMOTIONAL,
-            [re.compile(r"(?:답답|화가|짜증|열받|미치겠|환장)")],
-            [re.compile(r"(?:정말|너무)")],
-        ),
+        SegmentLabel.EMOTIONAL,
+        re.compile(r"(?:답답|화가|짜증|열받|미치겠|환장)"),
+        re.compile(r"(?:정말|너무)"),
     ),
     # 3. Speculation / assertion
     (
         "speculation",
-        (
-            SegmentLabel.EXCESS_DETAIL,
-            [re.compile(r"(?:틀림없이|확실히)")],
-            [re.compile(r"(?:아마|것\s*같다|것\s*같아|같다|듯\b|분명)")],
-        ),
+        SegmentLabel.EXCESS_DETAIL,
+        re.compile(r"(?:틀림없이|확실히)"),
+        re.compile(r"(?:아마|것\s*같다|것\s*같아|같다|듯\b|분명)"),
     ),
     # 4. Defensive structure
     (
         "defense",
-        (
-            SegmentLabel.SELF_JUSTIFICATION,
-            [re.compile(r"(?:내\s*탓\s*하려|말해\s*두는데)")],
-            [re.compile(r"(?:난\s.*했고|최선을\s*다했|제\s*잘못도\s*있지만)")],
-        ),
+        SegmentLabel.SELF_JUSTIFICATION,
+        re.compile(r"(?:내\s*탓\s*하려|말해\s*두는데)"),
+        re.compile(r"(?:난\s.*했고|최선을\s*다했|제\s*잘못도\s*있지만)"),
     ),
-]
+)
 
 
 def _score_blame_generalization(text: str) -> tuple[int, str]:
@@ -100,27 +83,59 @@ def _score_blame_generalization(text: str) -> tuple[int, str]:
     return score, "+".join(reasons) if reasons else ""
 
 
-def _score_category(text: str, cat_def: _CategoryDef) -> tuple[int, str]:
+def _score_category(text: str, strong: re.Pattern, soft: re.Pattern) -> tuple[int, str]:
     """Score a segment against a single category's patterns."""
-    _, strong_patterns, soft_patterns = cat_def
     score = 0
     reasons: list[str] = []
 
-    for pat in strong_patterns:
-        if pat.search(text):
-            score += 2
-            reasons.append(f"strong:{pat.pattern}")
-            break  # one strong hit is enough per category
+    if strong.search(text):
+        score += 2
+        reasons.append(f"strong:{strong.pattern}")
 
-    for pat in soft_patterns:
-        if pat.search(text):
-            score += 1
-            reasons.append(f"soft:{pat.pattern}")
-            break  # one soft hit is enough per category
+    if soft.search(text):
+        score += 1
+        reasons.append(f"soft:{soft.pattern}")
 
     return score, "+".join(reasons) if reasons else ""
 
 
+@functools.lru_cache(maxsize=2048)
+def _score_text(text: str) -> tuple[int, SegmentLabel | None, str]:
+    """Score raw segment text across all categories.
+
+    Returns (total_score, best_label, reason). Cached since only the text matters.
+    """
+    total_score = 0
+    all_reasons: list[str] = []
+    best_label: SegmentLabel | None = None
+    best_label_score = 0
+
+    # Score blame+generalization (special compound logic)
+    blame_score, blame_reason = _score_blame_generalization(text)
+    if blame_score > 0:
+        total_score += blame_score
+        all_reasons.append(f"blame({blame_reason})")
+        if blame_score > best_label_score:
+            best_label_score = blame_score
+            # Strong blame score means a recipient reference was found
+            if blame_score >= 2:
+                best_label = SegmentLabel.ACCOUNTABILITY
+            else:
+                best_label = SegmentLabel.NEGATIVE_FEEDBACK
+
+    # Score remaining categories
+    for cat_name, cat_label, strong, soft in _CATEGORIES:
+        cat_score, cat_reason = _score_category(text, strong, soft)
+        if cat_score > 0:
+            total_score += cat_score
+            all_reasons.append(f"{cat_name}({cat_reason})")
+            if cat_score > best_label_score:
+                best_label_score = cat_score
+                best_label = cat_label
+
+    return total_score, best_label, "; ".join(all_reasons)
+
+
 def scan_yellow_triggers(
     segments: list[Segment],
     labeled_segments: list[LabeledSegment],
@@ -140,40 +155,13 @@ def scan_yellow_triggers(
         if ls is None or ls.label.tier != SegmentLabelTier.GREEN:
             continue
 
-        text = seg.text
-        total_score = 0
-        all_reasons: list[str] = []
-        best_label: SegmentLabel | None = None
-        best_label_score = 0
-
-        # Score blame+generalization (special compound logic)
-        blame_score, blame_reason = _score_blame_generalization(text)
-        if blame_score > 0:
-            total_score += blame_score
-            all_reasons.append(f"blame({blame_reason})")
-            if blame_score > best_label_score:
-                best_label_score = blame_score
-                # Choose label based on whether there's recipient reference
-                if _RECIPIENT_RE.search(text):
-                    best_label = SegmentLabel.ACCOUNTABILITY
-                else:
-                    best_label = SegmentLabel.NEGATIVE_FEEDBACK
-
-        # Score remaining categories
-        for cat_name, cat_def in _CATEGORIES[1:]:  # skip blame (index 0)
-            cat_score, cat_reason = _score_category(text, cat_def)
-            if cat_score > 0:
-                total_score += cat_score
-                all_reasons.append(f"{cat_name}({cat_reason})")
-                if cat_score > best_label_score:
-                    best_label_score = cat_score
-                    best_label = cat_def[0]
+        total_score, best_label, reason = _score_text(seg.text)
 
         if total_score >= SCORE_THRESHOLD and best_label is not None:
             candidates.append(YellowUpgrade(
                 segment_id=seg.id,
                 new_label=best_label,
-                reason="; ".join(all_reasons),
+                reason=reason,
                 score=total_score,
             ))
 
@@ -20,6 +20,7 @@ import logging
 import re
 import time
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from app.models.domain import (
     LabeledSegment,
@@ -38,10 +39,23 @@ from app.models.enums import (
     ValidationIssueType,
 )
 from app.pipeline import multi_model_prompt_builder as prompt_builder_final
+from app.pipeline.ai_call_router import call_llm
+from app.pipeline.ai_transform_service import AiTransformError
+from app.pipeline.gating import (
+    gating_condition_evaluator,
+    identity_lock_booster,
+    situation_analysis_service,
+)
 from app.pipeline.gating.situation_analysis_service import SituationAnalysisResult
-from app.pipeline.preprocessing import locked_span_masker
+from app.pipeline.labeling import red_label_enforcer, structure_label_service
+from app.pipeline.preprocessing import locked_span_extractor, locked_span_masker, text_normalizer
+from app.pipeline.redaction import redaction_service
 from app.pipeline.redaction.redaction_service import RedactionResult
+from app.pipeline.segmentation import llm_segment_refiner, meaning_segmenter
+from app.pipeline.template import template_selector
 from app.pipeline.template.structure_template import StructureSection, StructureTemplate
+from app.pipeline.template.template_registry import get_registry
+from app.pipeline.validation import output_validator
 
 logger = logging.getLogger(__name__)
 
@@ -80,12 +94,12 @@ class PipelineProgressCallback:
 # ===== Result dataclasses =====
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisPhaseResult:
     masked_text: str
     locked_spans: list[LockedSpan]
     segments: list[Segment]
-    labeled_segments: list[LabeledSegment]
+    labeled_segments: list[LabeledSegment]  # sorted by start position
     redaction: RedactionResult
     situation_analysis: SituationAnalysisResult | None
     summary_text: str | None
@@ -100,11 +114,12 @@ class AnalysisPhaseResult:
     green_count: int
     yellow_count: int
     red_count: int
+    yellow_texts: list[str]  # YELLOW segment texts, for Rule 11 validation
     yellow_recovery_applied: bool = False
     yellow_upgrade_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinalPromptPair:
     system_prompt: str
     user_message: str
@@ -112,7 +127,7 @@ class FinalPromptPair:
     redaction_map: dict[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     transformed_text: str
     validation_issues: list[ValidationIssue] = field(default_factory=list)
@@ -122,6 +137,11 @@ class PipelineResult:
 # ===== Dedupe key helper =====
 
 _PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Z_]+)_(\d+)\}\}")
+_DEDUPE_STRIP_PATTERN = re.compile(r"[\s!\"#$%&'()*+,\-./:;<=>?@\[\\\]^_`{|}~]")
+
+
+def _placeholder_token(m: re.Match) -> str:
+    return m.group(1).lower() + "_" + m.group(2)
 
 
 def build_dedupe_key(text: str | None) -> str | None:
@@ -134,14 +154,36 @@ def build_dedupe_key(text: str | None) -> str | None:
     if not text or not text.strip():
         return None
 
-    def repl(m: re.Match) -> str:
-        return m.group(1).lower() + "_" + m.group(2)
-
-    result = _PLACEHOLDER_PATTERN.sub(repl, text)
-    result = re.sub(r"[\s\p{P}]" if False else r"[\s!\"#$%&'()*+,\-./:;<=>?@\[\\\]^_`{|}~]", "", result)
+    result = _PLACEHOLDER_PATTERN.sub(_placeholder_token, text)
+    result = _DEDUPE_STRIP_PATTERN.sub("", result)
     return result.lower()
 
 
+# Control chars are stripped by text_normalizer, so NUL never appears in segment text
+_DEDUPE_BATCH_SEPARATOR = "\x00"
+
+
+def build_dedupe_keys(texts: list[str | None]) -> list[str | None]:
+    """Batch build_dedupe_key: one regex pass over all texts joined by a separator."""
+    keys: list[str | None] = [None] * len(texts)
+    indices = [i for i, t in enumerate(texts) if t and t.strip()]
+    if not indices:
+        return keys
+
+    present = [texts[i] for i in indices]
+    if any(_DEDUPE_BATCH_SEPARATOR in t for t in present):
+        for i, t in zip(indices, present):
+            keys[i] = build_dedupe_key(t)
+        return keys
+
+    joined = _DEDUPE_BATCH_SEPARATOR.join(present)
+    joined = _PLACEHOLDER_PATTERN.sub(_placeholder_token, joined)
+    joined = _DEDUPE_STRIP_PATTERN.sub("", joined)
+    for i, key in zip(indices, joined.lower().split(_DEDUPE_BATCH_SEPARATOR)):
+        keys[i] = key
+    return keys
+
+
 # ===== Retryable warnings =====
 
 _RETRYABLE_WARNINGS = frozenset({
@@ -153,6 +195,27 @@ _RETRYABLE_WARNINGS = frozenset({
 })
 
 
+def _triage_issues(issues: list[ValidationIssue]) -> tuple[list[str], list[str], list[str], bool]:
+    """Split validation issues in one pass.
+
+    Returns (error_msgs, retryable_msgs, all_issue_msgs, needs_retry): a retry is
+    needed on any ERROR or any WARNING whose type is in _RETRYABLE_WARNINGS.
+    """
+    error_msgs: list[str] = []
+    retryable_msgs: list[str] = []
+    all_issue_msgs: list[str] = []
+    for i in issues:
+        severity = i.severity.value
+        if severity == "ERROR":
+            error_msgs.append(i.message)
+            all_issue_msgs.append(i.message)
+        elif i.type in _RETRYABLE_WARNINGS:
+            if severity == "WARNING":
+                retryable_msgs.append(i.message)
+            all_issue_msgs.append(i.message)
+    return error_msgs, retryable_msgs, all_issue_msgs, bool(error_msgs or retryable_msgs)
+
+
 # ===== Span merge helper =====
 
 
@@ -191,8 +254,16 @@ def compute_thinking_budget(
     score = 0
     if len(segments) >= 6:
         score += 1
-    yellow = sum(1 for s in labeled_segments if s.label.tier == SegmentLabelTier.YELLOW)
-    red = sum(1 for s in labeled_segments if s.label.tier == SegmentLabelTier.RED)
+    yellow_tier = SegmentLabelTier.YELLOW
+    red_tier = SegmentLabelTier.RED
+    yellow = 0
+    red = 0
+    for s in labeled_segments:
+        tier = s.label.tier
+        if tier is yellow_tier:
+            yellow += 1
+        elif tier is red_tier:
+            red += 1
     if yellow >= 2 or red >= 1:
         score += 1
     if original_text_length >= 500:
@@ -223,26 +294,13 @@ async def execute_analysis(
         ai_call_fn: async function(model, system, user, temp, max_tokens, analysis_context) -> LlmCallResult
         callback: progress callback for SSE streaming
     """
-    from app.pipeline.gating import (
-        gating_condition_evaluator,
-        identity_lock_booster,
-        situation_analysis_service,
-    )
-    from app.pipeline.labeling import red_label_enforcer, structure_label_service
-    from app.pipeline.preprocessing import locked_span_extractor, text_normalizer
-    from app.pipeline.redaction import redaction_service
-    from app.pipeline.segmentation import llm_segment_refiner, meaning_segmenter
-    from app.pipeline.template import template_selector
-    from app.pipeline.template.template_registry import TemplateRegistry
-
     if ai_call_fn is None:
-        from app.pipeline.ai_call_router import call_llm
         ai_call_fn = call_llm
 
     if callback is None:
         callback = PipelineProgressCallback()
 
-    registry = TemplateRegistry()
+    registry = get_registry()
 
     # A) Normalize
     await callback.on_phase("normalizing")
@@ -274,81 +332,88 @@ async def execute_analysis(
             )
         )
 
-    # E?) Identity Booster — launch async (does not block segmentation)
     booster_task: asyncio.Task | None = None
-    if gating_condition_evaluator.should_fire_identity_booster(
-        identity_booster_toggle, regex_spans, len(normalized),
-    ):
-        await callback.on_phase("identity_boosting")
-        booster_task = asyncio.create_task(
-            identity_lock_booster.boost(normalized, regex_spans, masked, ai_call_fn)
-        )
-    else:
-        await callback.on_phase("identity_skipped")
-
-    # C) Segment — uses regex-only masked text (unchanged)
-    await callback.on_phase("segmenting")
-    segments = meaning_segmenter.segment(masked)
-
-    # C') Refine long segments with LLM (conditional)
-    refine_result = await llm_segment_refiner.refine(segments, masked, ai_call_fn)
-    if refine_result.prompt_tokens > 0:
-        await callback.on_phase("segment_refining")
-        segments = refine_result.segments
-        total_prompt_tokens += refine_result.prompt_tokens
-        total_completion_tokens += refine_result.completion_tokens
-    else:
-        await callback.on_phase("segment_refining_skipped")
-    await callback.on_segmented(segments)
-
-    # D) Structure Label (LLM #1)
-    await callback.on_phase("labeling")
-    label_result = await structure_label_service.label_text_only(segments, masked, ai_call_fn)
-    total_prompt_tokens += label_result.prompt_tokens
-    total_completion_tokens += label_result.completion_tokens
-
-    # D') Server-side RED label enforcement
-    enforced_labels = red_label_enforcer.enforce(label_result.labeled_segments)
-    await callback.on_labeled(enforced_labels)
-
-    # E?) Collect Booster result (labeling complete, merge spans)
-    all_spans: list[LockedSpan] = list(regex_spans)
-    if booster_task is not None:
-        try:
-            boost_result = await booster_task
-            if boost_result.extra_spans:
-                all_spans = _merge_and_reindex_spans(regex_spans, boost_result.extra_spans)
-                booster_fired = True
-            total_prompt_tokens += boost_result.prompt_tokens
-            total_completion_tokens += boost_result.completion_tokens
-        except Exception as e:
-            logger.warning("[Pipeline] IdentityBooster failed, continuing without: %s", e)
-        if booster_fired:
-            await callback.on_spans_extracted(all_spans, masked)
-
-    # Collect Situation Analysis result (before template selection for metadata override)
-    situation_result: SituationAnalysisResult | None = None
-    if should_fire_situation and situation_task is not None:
-        await callback.on_phase("situation_analyzing")
-        try:
-            situation_result = await situation_task
-        except Exception as e:
-            from app.pipeline.ai_transform_service import AiTransformError
-            if isinstance(e, AiTransformError):
-                raise
-            raise AiTransformError("상황 분석 중 오류가 발생했습니다.") from e
-
-        # Filter RED-overlapping facts
-        situation_result = situation_analysis_service.filter_red_facts(
-            situation_result, masked, enforced_labels,
-        )
-        total_prompt_tokens += situation_result.prompt_tokens
-        total_completion_tokens += situation_result.completion_tokens
-        situation_fired = True
-        await callback.on_situation_analysis(True, situation_result)
-    else:
-        await callback.on_phase("situation_skipped")
-        await callback.on_situation_analysis(False, None)
+
+    # Background LLM tasks must not outlive a failed analysis (they would keep burning tokens)
+    try:
+        # E?) Identity Booster — launch async (does not block segmentation)
+        if gating_condition_evaluator.should_fire_identity_booster(
+            identity_booster_toggle, regex_spans, len(normalized),
+        ):
+            await callback.on_phase("identity_boosting")
+            booster_task = asyncio.create_task(
+                identity_lock_booster.boost(normalized, regex_spans, masked, ai_call_fn)
+            )
+        else:
+            await callback.on_phase("identity_skipped")
+
+        # C) Segment — uses regex-only masked text (unchanged)
+        await callback.on_phase("segmenting")
+        segments = meaning_segmenter.segment(masked)
+
+        # C') Refine long segments with LLM (conditional)
+        refine_result = await llm_segment_refiner.refine(segments, masked, ai_call_fn)
+        if refine_result.prompt_tokens > 0:
+            await callback.on_phase("segment_refining")
+            segments = refine_result.segments
+            total_prompt_tokens += refine_result.prompt_tokens
+            total_completion_tokens += refine_result.completion_tokens
+        else:
+            await callback.on_phase("segment_refining_skipped")
+        await callback.on_segmented(segments)
+
+        # D) Structure Label (LLM #1)
+        await callback.on_phase("labeling")
+        label_result = await structure_label_service.label_text_only(segments, masked, ai_call_fn)
+        total_prompt_tokens += label_result.prompt_tokens
+        total_completion_tokens += label_result.completion_tokens
+
+        # D') Server-side RED label enforcement (sorted by start once; final prompt order relies on it)
+        enforced_labels = sorted(red_label_enforcer.enforce(label_result.labeled_segments), key=attrgetter("start"))
+        await callback.on_labeled(enforced_labels)
+
+        # E?) Collect Booster result (labeling complete, merge spans)
+        all_spans: list[LockedSpan] = list(regex_spans)
+        if booster_task is not None:
+            try:
+                boost_result = await booster_task
+                if boost_result.extra_spans:
+                    all_spans = _merge_and_reindex_spans(regex_spans, boost_result.extra_spans)
+                    booster_fired = True
+                total_prompt_tokens += boost_result.prompt_tokens
+                total_completion_tokens += boost_result.completion_tokens
+            except Exception as e:
+                logger.warning("[Pipeline] IdentityBooster failed, continuing without: %s", e)
+            if booster_fired:
+                await callback.on_spans_extracted(all_spans, masked)
+
+        # Collect Situation Analysis result (before template selection for metadata override)
+        situation_result: SituationAnalysisResult | None = None
+        if should_fire_situation and situation_task is not None:
+            await callback.on_phase("situation_analyzing")
+            try:
+                situation_result = await situation_task
+            except Exception as e:
+                if isinstance(e, AiTransformError):
+                    raise
+                raise AiTransformError("상황 분석 중 오류가 발생했습니다.") from e
+
+            # Filter RED-overlapping facts
+            situation_result = situation_analysis_service.filter_red_facts(
+                situation_result, masked, enforced_labels,
+            )
+            total_prompt_tokens += situation_result.prompt_tokens
+            total_completion_tokens += situation_result.completion_tokens
+            situation_fired = True
+            await callback.on_situation_analysis(True, situation_result)
+        else:
+            await callback.on_phase("situation_skipped")
+            await callback.on_situation_analysis(False, None)
+    except BaseException:
+        for task in (situation_task, booster_task):
+            if task is not None and not task.done():
+                task.cancel()
+        raise
 
     # Template Selection
     effective_topic = topic
@@ -367,17 +432,27 @@ async def execute_analysis(
     redaction = redaction_service.process(enforced_labels)
     await callback.on_redacted(enforced_labels, redaction.red_count)
 
-    # Count tiers
-    green_count = sum(1 for s in enforced_labels if s.label.tier == SegmentLabelTier.GREEN)
+    # Count tiers + collect YELLOW texts in one pass
+    green = SegmentLabelTier.GREEN
+    yellow = SegmentLabelTier.YELLOW
+    green_count = 0
+    yellow_texts: list[str] = []
+    for ls in enforced_labels:
+        tier = ls.label.tier
+        if tier is green:
+            green_count += 1
+        elif tier is yellow:
+            yellow_texts.append(ls.text)
     yellow_count = redaction.yellow_count
     red_count = redaction.red_count
 
-    logger.info(
-        "[Pipeline] Analysis complete — segments=%d, GREEN=%d, YELLOW=%d, RED=%d, "
-        "booster=%s, situation=%s, template=%s, override=%s",
-        len(segments), green_count, yellow_count, red_count,
-        booster_fired, situation_fired, chosen_template.id, metadata_overridden,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[Pipeline] Analysis complete — segments=%d, GREEN=%d, YELLOW=%d, RED=%d, "
+            "booster=%s, situation=%s, template=%s, override=%s",
+            len(segments), green_count, yellow_count, red_count,
+            booster_fired, situation_fired, chosen_template.id, metadata_overridden,
+        )
 
     return AnalysisPhaseResult(
         masked_text=masked,
@@ -398,6 +473,7 @@ async def execute_analysis(
         green_count=green_count,
         yellow_count=yellow_count,
         red_count=red_count,
+        yellow_texts=yellow_texts,
         yellow_recovery_applied=label_result.yellow_recovery_applied,
         yellow_upgrade_count=label_result.yellow_upgrade_count,
     )
@@ -412,34 +488,35 @@ def build_final_prompt(
 
     Assigns order (by start position) and dedupeKey to each segment.
     """
-    # Assign order by start position
-    sorted_segments = sorted(analysis.labeled_segments, key=lambda ls: ls.start)
-
     # Collect booster (SEMANTIC) spans for segment text masking
     booster_spans = [s for s in analysis.locked_spans if s.type == LockedSpanType.SEMANTIC]
 
-    ordered_segments: list[prompt_builder_final.OrderedSegment] = []
-    for i, ls in enumerate(sorted_segments):
-        is_red = ls.label.tier == SegmentLabelTier.RED
-        seg_text = ls.text if not is_red else None
+    red = SegmentLabelTier.RED
+    yellow = SegmentLabelTier.YELLOW
+
+    sorted_segments = analysis.labeled_segments  # sorted by start in execute_analysis
+    seg_texts: list[str | None] = []
+    for ls in sorted_segments:
+        seg_text = ls.text if ls.label.tier is not red else None
 
         # Apply booster span placeholders to segment text
         if seg_text and booster_spans:
             for span in booster_spans:
                 if ls.start <= span.start_pos < ls.end:
                     seg_text = seg_text.replace(span.original_text, span.placeholder, 1)
+        seg_texts.append(seg_text)
 
-        dedupe_key = None if is_red else build_dedupe_key(seg_text)
-        must_include = (
-            prompt_builder_final.extract_placeholders(seg_text)
-            if ls.label.tier == SegmentLabelTier.YELLOW
-            else []
-        )
+    dedupe_keys = build_dedupe_keys(seg_texts)
+
+    ordered_segments: list[prompt_builder_final.OrderedSegment] = []
+    for i, (ls, seg_text, dedupe_key) in enumerate(zip(sorted_segments, seg_texts, dedupe_keys)):
+        tier = ls.label.tier
+        must_include = prompt_builder_final.extract_placeholders(seg_text) if tier is yellow else []
 
         ordered_segments.append(prompt_builder_final.OrderedSegment(
             id=ls.segment_id,
             order=i + 1,
-            tier=ls.label.tier.name,
+            tier=tier.name,
             label=ls.label.name,
             text=seg_text,
             dedupe_key=dedupe_key,
@@ -476,10 +553,7 @@ async def execute_final(
     rag_results=None,
 ) -> PipelineResult:
     """Run the Final model using analysis results."""
-    from app.pipeline.validation import output_validator
-
     if ai_call_fn is None:
-        from app.pipeline.ai_call_router import call_llm
         ai_call_fn = call_llm
 
     start_time = time.monotonic()
@@ -488,9 +562,6 @@ async def execute_final(
         analysis, sender_info, rag_results=rag_results,
     )
 
-    # Extract YELLOW segment texts for Rule 11
-    yellow_texts = [s.text for s in analysis.labeled_segments if s.label.tier == SegmentLabelTier.YELLOW]
-
     # Compute thinking budget for Gemini models
     thinking_budget = None
     if final_model_name.startswith("gemini-"):
@@ -508,26 +579,19 @@ async def execute_final(
     unmask_result = locked_span_masker.unmask(final_result.content, prompt.locked_spans)
 
     # Validate (with template info)
-    validation = output_validator.validate_with_template(
+    validation = await asyncio.to_thread(
+        output_validator.validate_with_template,
         unmask_result.text, original_text, prompt.locked_spans,
-        final_result.content, prompt.redaction_map, yellow_texts,
+        final_result.content, prompt.redaction_map, analysis.yellow_texts,
         analysis.chosen_template, analysis.effective_sections, analysis.labeled_segments,
     )
 
     retry_count = 0
 
     # Retry once on ERROR or retryable WARNING
-    has_retryable_warning = any(
-        i.severity.value == "WARNING" and i.type in _RETRYABLE_WARNINGS
-        for i in validation.issues
-    )
+    error_msgs, retryable_msgs, all_issue_msgs, needs_retry = _triage_issues(validation.issues)
 
-    if not validation.passed or has_retryable_warning:
-        error_msgs = [i.message for i in validation.errors()]
-        retryable_msgs = [
-            i.message for i in validation.issues
-            if i.severity.value == "WARNING" and i.type in _RETRYABLE_WARNINGS
-        ]
+    if needs_retry:
         logger.warning(
             "[Pipeline] Final validation issues (errors: %s, retryable warnings: %s), retrying once",
             error_msgs, retryable_msgs,
@@ -546,12 +610,8 @@ async def execute_final(
             validation.issues, prompt.locked_spans,
         )
 
-        all_issue_msgs = [
-            i.message for i in validation.issues
-            if i.severity.value == "ERROR" or i.type in _RETRYABLE_WARNINGS
-        ]
         error_hint = "\n\n[시스템 검증 오류] " + "; ".join(all_issue_msgs)
-        retry_user = prompt.user_message + error_hint + locked_span_hint
+        retry_user = "".join((prompt.user_message, error_hint, locked_span_hint))
 
         retry_thinking = None
         if thinking_budget is not None:
@@ -562,9 +622,10 @@ async def execute_final(
             thinking_budget=retry_thinking,
         )
         retry_unmask = locked_span_masker.unmask(retry_result.content, prompt.locked_spans)
-        validation = output_validator.validate_with_template(
+        validation = await asyncio.to_thread(
+            output_validator.validate_with_template,
             retry_unmask.text, original_text, prompt.locked_spans,
-            retry_result.content, prompt.redaction_map, yellow_texts,
+            retry_result.content, prompt.redaction_map, analysis.yellow_texts,
             analysis.chosen_template, analysis.effective_sections, analysis.labeled_segments,
         )
         unmask_result = retry_unmask
@@ -27,9 +27,9 @@ class OrderedSegment:
 
 def extract_placeholders(text: str | None) -> list[str]:
     """Extract {{TYPE_N}} placeholders from segment text."""
-    if text is None:
+    if text is None or "{{" not in text:
         return []
-    return [m.group() for m in _PLACEHOLDER_IN_TEXT.finditer(text)]
+    return _PLACEHOLDER_IN_TEXT.findall(text)
 
 
 # ===== Final Model system prompt =====
@@ -1,5 +1,6 @@
 """Template registry — 12 purpose-based templates (T01-T12)."""
 
+import functools
 from collections import OrderedDict
 
 from app.pipeline.template.structure_template import (
@@ -96,3 +97,9 @@ class TemplateRegistry:
 
     def all(self) -> list[StructureTemplate]:
         return list(self._templates.values())
+
+
+@functools.lru_cache(maxsize=1)
+def get_registry() -> TemplateRegistry:
+    """Shared registry instance; templates are immutable once registered."""
+    return TemplateRegistry()
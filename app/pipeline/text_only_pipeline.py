@@ -14,6 +14,7 @@ LLM calls: 2~3 (SA + Label + Final, Refiner conditional).
 import asyncio
 import logging
 import time
+from operator import attrgetter
 
 from app.core.config import settings
 from app.models.domain import (
@@ -30,9 +31,9 @@ from app.models.enums import (
 from app.pipeline import multi_model_prompt_builder as prompt_builder_final
 from app.pipeline.gating.situation_analysis_service import SituationAnalysisResult
 from app.pipeline.multi_model_pipeline import (
-    _RETRYABLE_WARNINGS,
     PipelineResult,
-    build_dedupe_key,
+    _triage_issues,
+    build_dedupe_keys,
     compute_thinking_budget,
 )
 from app.pipeline.preprocessing import locked_span_masker
@@ -53,14 +54,14 @@ async def execute(
     from app.pipeline.preprocessing import locked_span_extractor, text_normalizer
     from app.pipeline.redaction import redaction_service
     from app.pipeline.segmentation import llm_segment_refiner, meaning_segmenter
-    from app.pipeline.template.template_registry import TemplateRegistry
+    from app.pipeline.template.template_registry import get_registry
     from app.pipeline.validation import output_validator
 
     if ai_call_fn is None:
         from app.pipeline.ai_call_router import call_llm
         ai_call_fn = call_llm
 
-    registry = TemplateRegistry()
+    registry = get_registry()
     start_time = time.monotonic()
     total_prompt_tokens = 0
     total_completion_tokens = 0
@@ -156,24 +157,17 @@ async def execute(
     unmask_result = locked_span_masker.unmask(final_result.content, spans)
 
     yellow_texts = [s.text for s in enforced if s.label.tier == SegmentLabelTier.YELLOW]
-    validation = output_validator.validate_with_template(
+    validation = await asyncio.to_thread(
+        output_validator.validate_with_template,
         unmask_result.text, original_text, spans,
         final_result.content, redaction.redaction_map, yellow_texts,
         template, sections, enforced,
     )
 
     retry_count = 0
-    has_retryable_warning = any(
-        i.severity.value == "WARNING" and i.type in _RETRYABLE_WARNINGS
-        for i in validation.issues
-    )
+    error_msgs, retryable_msgs, all_issue_msgs, needs_retry = _triage_issues(validation.issues)
 
-    if not validation.passed or has_retryable_warning:
-        error_msgs = [i.message for i in validation.errors()]
-        retryable_msgs = [
-            i.message for i in validation.issues
-            if i.severity.value == "WARNING" and i.type in _RETRYABLE_WARNINGS
-        ]
+    if needs_retry:
         logger.warning(
             "[TextOnlyPipeline] Validation issues (errors: %s, retryable warnings: %s), retrying once",
             error_msgs, retryable_msgs,
@@ -192,12 +186,8 @@ async def execute(
             validation.issues, spans,
         )
 
-        all_issue_msgs = [
-            i.message for i in validation.issues
-            if i.severity.value == "ERROR" or i.type in _RETRYABLE_WARNINGS
-        ]
         error_hint = "\n\n[시스템 검증 오류] " + "; ".join(all_issue_msgs)
-        retry_user = user_message + error_hint + locked_span_hint
+        retry_user = "".join((user_message, error_hint, locked_span_hint))
 
         retry_thinking = None
         if thinking_budget is not None:
@@ -208,7 +198,8 @@ async def execute(
             thinking_budget=retry_thinking,
         )
         retry_unmask = locked_span_masker.unmask(retry_result.content, spans)
-        validation = output_validator.validate_with_template(
+        validation = await asyncio.to_thread(
+            output_validator.validate_with_template,
             retry_unmask.text, original_text, spans,
             retry_result.content, redaction.redaction_map, yellow_texts,
             template, sections, enforced,
@@ -280,31 +271,34 @@ def _build_ordered_segments(
     locked_spans: list[LockedSpan],
 ) -> list[prompt_builder_final.OrderedSegment]:
     """Sort segments by start pos, build OrderedSegment with dedupeKey/mustInclude."""
-    sorted_segments = sorted(labeled_segments, key=lambda ls: ls.start)
+    sorted_segments = sorted(labeled_segments, key=attrgetter("start"))
     booster_spans = [s for s in locked_spans if s.type == LockedSpanType.SEMANTIC]
 
-    ordered: list[prompt_builder_final.OrderedSegment] = []
-    for i, ls in enumerate(sorted_segments):
-        is_red = ls.label.tier == SegmentLabelTier.RED
-        seg_text = ls.text if not is_red else None
+    red = SegmentLabelTier.RED
+    yellow = SegmentLabelTier.YELLOW
+
+    seg_texts: list[str | None] = []
+    for ls in sorted_segments:
+        seg_text = ls.text if ls.label.tier is not red else None
 
         # Apply booster span placeholders (unlikely in text-only, but handle)
         if seg_text and booster_spans:
             for span in booster_spans:
                 if ls.start <= span.start_pos < ls.end:
                     seg_text = seg_text.replace(span.original_text, span.placeholder, 1)
+        seg_texts.append(seg_text)
 
-        dedupe_key = None if is_red else build_dedupe_key(seg_text)
-        must_include = (
-            prompt_builder_final.extract_placeholders(seg_text)
-            if ls.label.tier == SegmentLabelTier.YELLOW
-            else []
-        )
+    dedupe_keys = build_dedupe_keys(seg_texts)
+
+    ordered: list[prompt_builder_final.OrderedSegment] = []
+    for i, (ls, seg_text, dedupe_key) in enumerate(zip(sorted_segments, seg_texts, dedupe_keys)):
+        tier = ls.label.tier
+        must_include = prompt_builder_final.extract_placeholders(seg_text) if tier is yellow else []
 
         ordered.append(prompt_builder_final.OrderedSegment(
             id=ls.segment_id,
             order=i + 1,
-            tier=ls.label.tier.name,
+            tier=tier.name,
             label=ls.label.name,
             text=seg_text,
             dedupe_key=dedupe_key,
@@ -615,9 +615,4 @@ def _contains_with_particle_variation(text: str, word: str) -> bool:
 
 
 def _extract_meaning_words(text: str) -> list[str]:
-    words: list[str] = []
-    for m in _KOREAN_WORD.finditer(text):
-        word = m.group()
-        if word not in _STOPWORDS:
-            words.append(word)
-    return words
+    return [word for word in _KOREAN_WORD.findall(text) if word not in _STOPWORDS]
@@ -0,0 +1,128 @@
+"""Tests for the LLM call router's exact-match response cache."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.domain import LlmCallResult
+from app.pipeline import ai_call_router
+from app.pipeline.ai_transform_service import AiTransformError
+
+MODEL = "gpt-4o-mini"
+
+
+def _result(content: str = "ok") -> LlmCallResult:
+    return LlmCallResult(content, None, prompt_tokens=100, completion_tokens=20)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    ai_call_router._cache.clear()
+    yield
+    ai_call_router._cache.clear()
+
+
+def _patch_provider(**kwargs):
+    return patch(
+        "app.pipeline.ai_transform_service.call_openai_with_model",
+        new_callable=AsyncMock,
+        **kwargs,
+    )
+
+
+async def _call(user: str = "user", temp: float = 0.2, cacheable: bool = True) -> LlmCallResult:
+    return await ai_call_router.call_llm(MODEL, "system", user, temp, 100, None, cacheable=cacheable)
+
+
+# --- Hits ---
+
+
+async def test_cache_hit_returns_zero_tokens():
+    with _patch_provider(return_value=_result()) as provider:
+        first = await _call()
+        second = await _call()
+    assert provider.await_count == 1
+    assert first.prompt_tokens == 100
+    assert second.content == "ok"
+    assert second.prompt_tokens == 0
+    assert second.completion_tokens == 0
+
+
+async def test_cache_key_includes_user_message():
+    with _patch_provider(return_value=_result()) as provider:
+        await _call("a")
+        await _call("b")
+    assert provider.await_count == 2
+
+
+# --- Gate ---
+
+
+async def test_not_cached_without_opt_in():
+    with _patch_provider(return_value=_result()) as provider:
+        await _call(cacheable=False)
+        await _call(cacheable=False)
+    assert provider.await_count == 2
+    assert not ai_call_router._cache
+
+
+@pytest.mark.parametrize("temp", [-1, 0.31, 0.85])
+async def test_not_cached_above_temperature_limit(temp):
+    with _patch_provider(return_value=_result()) as provider:
+        await _call(temp=temp)
+        await _call(temp=temp)
+    assert provider.await_count == 2
+    assert not ai_call_router._cache
+
+
+async def test_not_cached_when_ttl_disabled(monkeypatch):
+    monkeypatch.setattr(ai_call_router.settings, "llm_response_cache_ttl_s", 0)
+    with _patch_provider(return_value=_result()) as provider:
+        await _call()
+        await _call()
+    assert provider.await_count == 2
+
+
+async def test_error_is_not_cached():
+    with _patch_provider(side_effect=AiTransformError("boom")) as provider:
+        with pytest.raises(AiTransformError):
+            await _call()
+    assert not ai_call_router._cache
+
+    with _patch_provider(return_value=_result()) as provider:
+        result = await _call()
+    assert provider.await_count == 1
+    assert result.prompt_tokens == 100
+
+
+# --- Expiry / eviction ---
+
+
+async def test_expired_entry_hits_model_again():
+    with _patch_provider(return_value=_result()) as provider:
+        await _call()
+        for key, (_, cached) in list(ai_call_router._cache.items()):
+            ai_call_router._cache[key] = (time.monotonic() - 1, cached)
+        result = await _call()
+    assert provider.await_count == 2
+    assert result.prompt_tokens == 100
+
+
+async def test_lru_evicts_least_recently_used():
+    limit = ai_call_router._CACHE_MAX_ENTRIES
+    with _patch_provider(return_value=_result()) as provider:
+        for n in range(limit):
+            await _call(f"msg-{n}")
+        assert len(ai_call_router._cache) == limit
+
+        # Touch the oldest entry so msg-1 becomes least recently used
+        await _call("msg-0")
+        await _call("overflow")
+        assert len(ai_call_router._cache) == limit
+        assert provider.await_count == limit + 1
+
+        await _call("msg-0")
+        assert provider.await_count == limit + 1
+        await _call("msg-1")
+        assert provider.await_count == limit + 2
@@ -0,0 +1,51 @@
+"""Tests for multi-model pipeline helpers."""
+
+import pytest
+
+from app.models.domain import ValidationIssue
+from app.models.enums import Severity, ValidationIssueType
+from app.pipeline.multi_model_pipeline import _triage_issues, build_dedupe_key, build_dedupe_keys
+
+# --- Dedupe keys ---
+
+
+def test_build_dedupe_keys_matches_per_item():
+    texts = [
+        "안녕하세요, 팀장님!",
+        None,
+        "",
+        "   ",
+        "{{EMAIL_1}}로 연락 주세요.",
+        "Deadline: 2024-03-15 (Fri)",
+        "안녕하세요, 팀장님!",
+        "\t줄바꿈\n포함\t",
+    ]
+    assert build_dedupe_keys(texts) == [build_dedupe_key(t) for t in texts]
+
+
+def test_build_dedupe_keys_separator_in_input_falls_back():
+    texts = ["앞\x00뒤", None, "{{PHONE_2}} 확인", ""]
+    assert build_dedupe_keys(texts) == [build_dedupe_key(t) for t in texts]
+
+
+def test_build_dedupe_keys_all_blank():
+    assert build_dedupe_keys([None, "", "  "]) == [None, None, None]
+    assert build_dedupe_keys([]) == []
+
+
+# --- Issue triage ---
+
+_EMOJI_ERROR = ValidationIssue(ValidationIssueType.EMOJI, Severity.ERROR, "emoji")
+_NUMBER_WARNING = ValidationIssue(ValidationIssueType.CORE_NUMBER_MISSING, Severity.WARNING, "number")
+_ENDING_WARNING = ValidationIssue(ValidationIssueType.ENDING_REPETITION, Severity.WARNING, "ending")
+
+
+@pytest.mark.parametrize(("issues", "errors", "retryable", "all_msgs", "needs_retry"), [
+    ([_EMOJI_ERROR], ["emoji"], [], ["emoji"], True),
+    ([_NUMBER_WARNING], [], ["number"], ["number"], True),
+    ([_ENDING_WARNING], [], [], [], False),
+    ([], [], [], [], False),
+    ([_ENDING_WARNING, _NUMBER_WARNING, _EMOJI_ERROR], ["emoji"], ["number"], ["number", "emoji"], True),
+], ids=["error-only", "retryable-warning", "non-retryable-warning", "no-issues", "mixed"])
+def test_triage_issues(issues, errors, retryable, all_msgs, needs_retry):
+    assert _triage_issues(issues) == (errors, retryable, all_msgs, needs_retry)
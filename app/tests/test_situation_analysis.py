@@ -0,0 +1,36 @@
+"""Tests for situation analysis response parsing."""
+
+from app.models.domain import LlmCallResult
+from app.pipeline.gating.situation_analysis_service import Fact, _parse_result_text_only
+
+
+def _parse(content: str):
+    return _parse_result_text_only(LlmCallResult(content, None, prompt_tokens=10, completion_tokens=5))
+
+
+def test_parse_text_only_facts_and_intent():
+    result = _parse('{"facts": [{"content": "마감은 금요일", "source": "금요일까지"}], "intent": "일정 확인"}')
+    assert result.facts == [Fact(content="마감은 금요일", source="금요일까지")]
+    assert result.intent == "일정 확인"
+    assert result.prompt_tokens == 10
+
+
+def test_parse_text_only_skips_non_string_fact_fields():
+    result = _parse(
+        '{"facts": ['
+        '{"content": 3, "source": "a"},'
+        '{"content": "b", "source": null},'
+        '{"content": "c", "source": {"x": 1}},'
+        '{"content": ["d"], "source": "d"},'
+        '"not a dict",'
+        '{"content": "kept"}'
+        '], "intent": 7}'
+    )
+    assert result.facts == [Fact(content="kept", source="")]
+    assert result.intent == ""
+
+
+def test_parse_text_only_invalid_json():
+    result = _parse("not json")
+    assert result.facts == []
+    assert result.intent == ""
@@ -0,0 +1,53 @@
+"""Tests for SSE frame encoding in the streaming service."""
+
+import json
+
+import orjson
+import pytest
+from sse_starlette.sse import ServerSentEvent
+
+from app.pipeline.ai_streaming_service import _encode_sse_frame
+
+
+def _data_lines(frame: bytes) -> list[bytes]:
+    return [line[len(b"data: "):] for line in frame.split(b"\r\n") if line.startswith(b"data: ")]
+
+
+# --- String data ---
+
+
+@pytest.mark.parametrize("data", [
+    "",
+    "안녕하세요",
+    "line one\nline two",
+    "crlf\r\nsplit",
+    "cr\rsplit",
+    "trailing newline\n",
+])
+def test_string_frame_matches_sse_starlette(data):
+    assert _encode_sse_frame("delta", data) == ServerSentEvent(data=data, event="delta").encode()
+
+
+def test_multiline_string_becomes_multiple_data_lines():
+    frame = _encode_sse_frame("delta", "a\nb\nc")
+    assert _data_lines(frame) == [b"a", b"b", b"c"]
+
+
+# --- JSON data ---
+
+
+@pytest.mark.parametrize("data", [
+    {"segmentCount": 3, "text": "줄바꿈\n포함"},
+    [{"id": "T1", "label": "CORE_FACT"}, {"id": "T2", "label": "AGGRESSION"}],
+    [],
+])
+def test_json_frame_matches_sse_starlette(data):
+    expected = ServerSentEvent(data=orjson.dumps(data).decode(), event="stats").encode()
+    assert _encode_sse_frame("stats", data) == expected
+
+
+def test_json_frame_is_single_line_and_round_trips():
+    data = {"text": "a\nb", "nested": {"items": [1, 2]}}
+    lines = _data_lines(_encode_sse_frame("stats", data))
+    assert len(lines) == 1
+    assert json.loads(lines[0]) == data
@@ -0,0 +1,56 @@
+"""Tests for SSE generator shutdown in the streaming service."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.pipeline import ai_streaming_service
+
+
+class _HangingAnalysis:
+    """Stand-in for execute_analysis: pushes `events` phases, then blocks until cancelled."""
+
+    def __init__(self, events: int):
+        self.events = events
+        self.cancelled = asyncio.Event()
+
+    async def __call__(self, *args, callback, **kwargs):
+        try:
+            for n in range(self.events):
+                await callback.on_phase(f"phase-{n}")
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+def _stream():
+    return ai_streaming_service.stream_transform("원문", None, None, False, None, None, 100)
+
+
+@pytest.mark.parametrize("events", [1, ai_streaming_service._QUEUE_MAXSIZE + 10])
+async def test_aclose_mid_stream_cancels_pipeline(events):
+    analysis = _HangingAnalysis(events)
+    with patch.object(ai_streaming_service, "execute_analysis", analysis):
+        gen = _stream()
+        assert (await gen.__anext__()).startswith(b"event: phase")
+        await asyncio.wait_for(gen.aclose(), timeout=2)
+    assert analysis.cancelled.is_set()
+
+
+async def test_cancelled_consumer_cancels_pipeline():
+    analysis = _HangingAnalysis(ai_streaming_service._QUEUE_MAXSIZE + 10)
+    first_frame = asyncio.Event()
+
+    async def consume():
+        async for _ in _stream():
+            first_frame.set()
+
+    with patch.object(ai_streaming_service, "execute_analysis", analysis):
+        consumer = asyncio.create_task(consume())
+        await asyncio.wait_for(first_frame.wait(), timeout=2)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(consumer, timeout=2)
+    assert analysis.cancelled.is_set()
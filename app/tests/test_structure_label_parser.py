@@ -0,0 +1,80 @@
+"""Tests for structure label output parsing."""
+
+from app.models.domain import LabeledSegment, Segment
+from app.models.enums import SegmentLabel
+from app.pipeline.labeling.structure_label_service import _parse_content
+
+SEGMENTS = {
+    "T1": Segment("T1", "보고서 제출 부탁드립니다", 0, 12),
+    "T2": Segment("T2", "왜 이렇게 늦었나요", 13, 23),
+}
+
+
+def _labels(labeled: list[LabeledSegment]) -> list[tuple[str, SegmentLabel]]:
+    return [(ls.segment_id, ls.label) for ls in labeled]
+
+
+# --- Fences ---
+
+
+def test_parse_unfenced():
+    labeled, summary, nongreen = _parse_content(
+        "T1|REQUEST\nT2|NEGATIVE_FEEDBACK\nSUMMARY: 제출 요청", SEGMENTS,
+    )
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST), ("T2", SegmentLabel.NEGATIVE_FEEDBACK)]
+    assert summary == "제출 요청"
+    assert nongreen == 1
+
+
+def test_parse_fenced():
+    labeled, summary, nongreen = _parse_content(
+        "```text\nT1|REQUEST\nT2|NEGATIVE_FEEDBACK\nSUMMARY: 제출 요청\n```", SEGMENTS,
+    )
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST), ("T2", SegmentLabel.NEGATIVE_FEEDBACK)]
+    assert summary == "제출 요청"
+    assert nongreen == 1
+
+
+def test_parse_unclosed_fence():
+    labeled, summary, _ = _parse_content("```\nT1|REQUEST\nT2|CORE_FACT\nSUMMARY: 요약", SEGMENTS)
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST), ("T2", SegmentLabel.CORE_FACT)]
+    assert summary == "요약"
+
+
+def test_parse_summary_with_trailing_fence():
+    # The closing fence on the SUMMARY line belongs to the code block, not the summary
+    labeled, summary, _ = _parse_content("```\nT1|REQUEST\nSUMMARY: 요약```", SEGMENTS)
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST)]
+    assert summary == "요약"
+
+
+def test_parse_crlf():
+    labeled, summary, _ = _parse_content(
+        "```\r\nT1|REQUEST\r\nT2|AGGRESSION\r\nSUMMARY: 요약\r\n```\r\n", SEGMENTS,
+    )
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST), ("T2", SegmentLabel.AGGRESSION)]
+    assert summary == "요약"
+
+
+# --- Segment IDs / labels ---
+
+
+def test_parse_skips_unknown_and_duplicate_segment_ids():
+    labeled, _, _ = _parse_content("T9|REQUEST\nT1|REQUEST\nT1|AGGRESSION\n**T2**|CORE_FACT", SEGMENTS)
+    assert _labels(labeled) == [("T1", SegmentLabel.REQUEST), ("T2", SegmentLabel.CORE_FACT)]
+
+
+def test_parse_unknown_label_defaults_to_courtesy():
+    labeled, _, nongreen = _parse_content("T1|NOT_A_LABEL", SEGMENTS)
+    assert _labels(labeled) == [("T1", SegmentLabel.COURTESY)]
+    assert nongreen == 0
+
+
+def test_parse_migrates_legacy_label():
+    labeled, _, nongreen = _parse_content("T1|SELF_DEFENSIVE|extra", SEGMENTS)
+    assert _labels(labeled) == [("T1", SegmentLabel.SELF_JUSTIFICATION)]
+    assert nongreen == 1
+
+
+def test_parse_empty_output():
+    assert _parse_content("  \n", SEGMENTS) == ([], None, 0)